@@ -7,7 +7,7 @@ from tool.database import get_db
 from tool.security import get_current_user
 from app.models.user import User
 from app.models.precedent_favorite import PrecedentFavorite
-from app.services.precedent_search_service import PrecedentSearchService
+from app.services.precedent_search_service import get_precedent_search_service
 from app.services.precedent_repository import PrecedentRepository
 
 logger = logging.getLogger(__name__)
@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 # 판례 검색 서비스
-search_service = PrecedentSearchService()
+search_service = get_precedent_search_service()
 # 판례 저장소 (배치 조회용)
 precedent_repository = PrecedentRepository()
 
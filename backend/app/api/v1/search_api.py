@@ -11,8 +11,8 @@ from pydantic import BaseModel
 from typing import Optional
 from sqlalchemy.orm import Session
 
-from app.services.precedent_search_service import PrecedentSearchService
-from app.services.precedent_similar_service import PrecedentSimilarService
+from app.services.precedent_search_service import get_precedent_search_service
+from app.services.precedent_similar_service import get_precedent_similar_service
 from app.services.precedent_summary_service import SummaryService
 from app.services.comparison_service import ComparisonService
 from app.models.evidence import Case, CaseAnalysis
@@ -119,8 +119,8 @@ def _cleanup_old_comparisons(db: Session, case_id: int, max_count: int = 10):
 
 
 # 서비스 인스턴스
-search_service = PrecedentSearchService()
-similar_search_service = PrecedentSimilarService()
+search_service = get_precedent_search_service()
+similar_search_service = get_precedent_similar_service()
 summary_service = SummaryService()
 comparison_service = ComparisonService()
 
@@ -17,7 +17,7 @@ from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
-from app.services.search_laws_service import SearchLawsService
+from app.services.search_laws_service import get_search_laws_service
 from app.models.evidence import Case, CaseAnalysis
 from tool.database import get_db
 from tool.security import get_current_user
@@ -52,7 +52,7 @@ class GetArticleRequest(BaseModel):
 router = APIRouter(prefix="/laws", tags=["laws"])
 
 # 서비스 인스턴스
-search_laws_service = SearchLawsService()
+search_laws_service = get_search_laws_service()
 
 
 @router.post("/search")
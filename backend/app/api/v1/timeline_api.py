@@ -1,20 +1,23 @@
+import asyncio
 import logging
+import uuid
+from datetime import datetime, timedelta
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from app.services.timeline_service import TimeLineService
-from app.models.timeline import TimeLine
+from app.models.timeline import TimeLine, TimelineJob
 from app.models.evidence import Case, Evidence
 from app.models.user import User
 from tool.database import SessionLocal
 from tool.security import get_current_user
+from app.config import TimelineConfig
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/timeline", tags=["timeline"])
 
-
 # DB 세션 의존성
 def get_db():
     db = SessionLocal()
@@ -325,7 +328,7 @@ async def generate_timeline(
 
     Args:
         case_id: 사건 ID (문자열 "CASE-001" 형식 또는 숫자)
-        force: 기존 타임라인 삭제 여부 (기본값: True)
+        force: 기존 타임라인 교체 여부 (기본값: True, 생성 성공 시에만 교체)
         db: 데이터베이스 세션
 
     Returns:
@@ -347,24 +350,20 @@ async def generate_timeline(
         if case.law_firm_id != current_user.firm_id:
             raise HTTPException(status_code=403, detail="해당 사건에 접근할 권한이 없습니다")
 
-        # Step 1: 기존 타임라인 삭제 (force=True인 경우)
-        if force:
-            deleted_count = db.query(TimeLine).filter(
-                TimeLine.case_id == numeric_case_id
-            ).delete()
-            db.commit()
-            logger.debug(f"[Timeline Generate API] 기존 타임라인 삭제: {deleted_count}개")
-
-        # Step 2: 새 타임라인 생성
+        # Step 1: 새 타임라인 생성
+        # force=True면 생성 성공 후 기존 타임라인 삭제 + 저장을 한 트랜잭션으로 교체 (실패 시 기존 유지)
         logger.debug("[Timeline Generate API] TimeLineService 초기화")
         timeline_service = TimeLineService(db=db, case_id=numeric_case_id)
 
         logger.debug("[Timeline Generate API] 타임라인 생성 실행")
-        generated_timelines = await timeline_service.generate_timeline_auto()
+        # 강제 재생성: 이전 결과가 마음에 들지 않아 요청한 것이므로 입력 해시 캐시를 사용하지 않음
+        generated_timelines = await timeline_service.generate_timeline_auto(
+            use_cache=not force, replace_existing=force
+        )
 
         logger.info(f"[Timeline Generate API] 생성 완료: {len(generated_timelines)}개")
 
-        # Step 3: 응답 형식으로 변환 (증거 정보 포함)
+        # Step 2: 응답 형식으로 변환 (증거 정보 포함)
         result = []
         for timeline in generated_timelines:
             result.append(format_timeline_with_evidence(timeline, db))
@@ -378,3 +377,129 @@ async def generate_timeline(
         logger.error(f"[Timeline Generate API] 에러: {e}", exc_info=True)
         db.rollback()
         raise HTTPException(status_code=500, detail="타임라인 생성 중 오류가 발생했습니다")
+
+
+# ==================== 비동기 생성 (job_id 반환) ====================
+
+def _update_timeline_job(job_id: str, **fields) -> None:
+    """
+    작업 상태 갱신 (timeline_jobs 테이블)
+    생성 트랜잭션과 분리하기 위해 짧은 별도 세션에서 커밋
+    """
+    db = SessionLocal()
+    try:
+        db.query(TimelineJob).filter(TimelineJob.id == job_id).update(
+            {**fields, "updated_at": datetime.utcnow()}, synchronize_session=False
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[Timeline Job] 상태 갱신 실패: job_id={job_id}, {e}", exc_info=True)
+    finally:
+        db.close()
+
+
+async def _run_timeline_job(job_id: str, case_id: int, force: bool):
+    """
+    백그라운드에서 타임라인을 생성하고 작업 상태를 갱신
+    요청 세션은 응답 후 닫히므로 별도 세션을 열어 사용
+    """
+    await asyncio.to_thread(_update_timeline_job, job_id, status="running")
+
+    db = SessionLocal()
+    try:
+        # force=True면 생성 성공 후에만 기존 타임라인을 교체 (실패 시 기존 타임라인 유지)
+        timeline_service = TimeLineService(db=db, case_id=case_id)
+        generated_timelines = await timeline_service.generate_timeline_auto(
+            use_cache=not force, replace_existing=force
+        )
+
+        await asyncio.to_thread(
+            _update_timeline_job, job_id, status="done", count=len(generated_timelines)
+        )
+        logger.info(f"[Timeline Job] 생성 완료: job_id={job_id}, {len(generated_timelines)}개")
+    except Exception as e:
+        db.rollback()
+        await asyncio.to_thread(
+            _update_timeline_job, job_id, status="failed", error="타임라인 생성 중 오류가 발생했습니다"
+        )
+        logger.error(f"[Timeline Job] 에러: job_id={job_id}, {e}", exc_info=True)
+    finally:
+        db.close()
+
+
+@router.post("/{case_id}/generate-async", status_code=202)
+async def generate_timeline_async(
+    case_id: str,
+    background_tasks: BackgroundTasks,
+    force: bool = True,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    타임라인 재생성 작업 등록 (즉시 반환)
+
+    LLM 호출을 기다리지 않고 job_id를 바로 반환합니다.
+    진행 상태는 GET /timeline/status/{job_id}로 폴링하고,
+    완료(done) 후 GET /timeline/{case_id}로 결과를 조회합니다.
+
+    Args:
+        case_id: 사건 ID (문자열 "CASE-001" 형식 또는 숫자)
+        force: 기존 타임라인 교체 여부 (기본값: True, 생성 성공 시에만 교체)
+        db: 데이터베이스 세션
+
+    Returns:
+        job_id, status
+    """
+    try:
+        # case_id 파싱
+        if isinstance(case_id, str) and case_id.startswith("CASE-"):
+            numeric_case_id = int(case_id.split("-")[1])
+        else:
+            numeric_case_id = int(case_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 사건 ID입니다")
+
+    # 소유권 검증
+    case = db.query(Case).filter(Case.id == numeric_case_id).first()
+    if not case:
+        raise HTTPException(status_code=404, detail="사건을 찾을 수 없습니다")
+    if case.law_firm_id != current_user.firm_id:
+        raise HTTPException(status_code=403, detail="해당 사건에 접근할 권한이 없습니다")
+
+    # 작업 상태는 DB에 저장 → 어느 워커로 폴링해도 조회됨
+    job_id = uuid.uuid4().hex
+    db.add(TimelineJob(id=job_id, case_id=numeric_case_id, firm_id=case.law_firm_id, status="pending"))
+    db.commit()
+    background_tasks.add_task(_run_timeline_job, job_id, numeric_case_id, force)
+
+    logger.debug(f"[Timeline Generate Async] 작업 등록: job_id={job_id}, case_id={numeric_case_id}")
+    return {"job_id": job_id, "status": "pending"}
+
+
+@router.get("/status/{job_id}")
+def get_timeline_job_status(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    타임라인 생성 작업 상태 조회
+
+    pending/running 상태로 TimelineConfig.JOB_STALE_SECONDS 이상 갱신이 없으면
+    (작업 중 워커 재시작 등) failed로 전환해 반환합니다.
+
+    Returns:
+        job_id, case_id, status(pending | running | done | failed), count, error
+    """
+    job = db.query(TimelineJob).filter(TimelineJob.id == job_id).first()
+    if job is None or job.firm_id != current_user.firm_id:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+
+    stale_before = datetime.utcnow() - timedelta(seconds=TimelineConfig.JOB_STALE_SECONDS)
+    if job.status in ("pending", "running") and job.updated_at and job.updated_at < stale_before:
+        job.status = "failed"
+        job.error = "작업이 중단되었습니다. 다시 시도해주세요"
+        db.commit()
+
+    return job.to_dict()
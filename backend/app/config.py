@@ -32,6 +32,11 @@ class EmbeddingConfig:
     # 워밍업 핑 간격 (분)
     WARMUP_INTERVAL_MINUTES = 10
 
+    # Sparse(BM25) ONNX 스레드 수
+    # uvicorn --workers N 이면 프로세스마다 코어 수만큼 스레드가 생겨 과다 경합 → 코어 / 워커 수로 제한
+    WEB_WORKERS = int(os.getenv("WEB_CONCURRENCY", "2"))  # Dockerfile의 --workers 값과 맞출 것
+    SPARSE_THREADS = int(os.getenv("SPARSE_EMBED_THREADS", max(1, (os.cpu_count() or 1) // WEB_WORKERS)))
+
     # 요약용 (유사 판례 검색에 사용) - OpenAI만 사용
     SUMMARY_MODEL = "text-embedding-3-large"
     SUMMARY_DIMENSION = 3072
@@ -48,6 +53,32 @@ class QuantizationConfig:
     OVERSAMPLING = 20.0  # 후보 배수 (limit × 20 = 100개 후보)
 
 
+class HnswConfig:
+    """HNSW 검색 설정"""
+    EF = 64  # 최소 탐색 폭 (Qdrant 기본 128) - 실제 값은 max(EF, limit)로 조정
+
+
+class RerankerConfig:
+    """Cross-encoder 리랭커 설정"""
+    MODEL = "BAAI/bge-reranker-v2-m3"
+    MAX_LENGTH = int(os.getenv("RERANKER_MAX_LENGTH", "4096"))  # (쿼리, 청크) 쌍 최대 토큰 수 - 초과분은 토크나이저가 잘라냄 (낮추면 긴 청크 뒷부분이 점수에서 빠짐)
+    BACKEND = os.getenv("RERANKER_BACKEND", "onnx")  # "onnx" | "torch"
+    ONNX_QUANTIZATION = os.getenv("RERANKER_ONNX_QUANTIZATION", "avx512_vnni")  # arm64 | avx2 | avx512 | avx512_vnni
+    ONNX_CACHE_DIR = os.getenv("RERANKER_ONNX_CACHE_DIR", "/tmp/reranker_onnx")  # 최초 부팅 시 export 결과 저장
+    TORCH_BF16 = os.getenv("RERANKER_BF16", "false").lower() in ("true", "1", "yes")  # torch 백엔드 전용 (AVX-512 BF16/AMX CPU)
+
+
+class TimelineConfig:
+    """타임라인 생성 설정"""
+    # 증거 1건당 프롬프트에 포함할 최대 글자 수 (DB에서 substr로 잘라서 조회)
+    MAX_EVIDENCE_CHARS = int(os.getenv("TIMELINE_MAX_EVIDENCE_CHARS", "8000"))
+    # 이 글자 수를 넘는 증거는 사건 요약/사실관계와 겹치는 어휘가 많은 구간만 골라 프롬프트에 포함
+    EVIDENCE_PROMPT_CHARS = int(os.getenv("TIMELINE_EVIDENCE_PROMPT_CHARS", "3000"))
+    SNIPPET_WINDOW_CHARS = 400  # 관련도 계산 단위 구간 길이
+    # pending/running 상태로 이 시간(초) 이상 갱신 없는 비동기 작업은 실패로 간주 (워커 재시작 등으로 중단된 작업)
+    JOB_STALE_SECONDS = int(os.getenv("TIMELINE_JOB_STALE_SECONDS", "900"))
+
+
 class CollectionConfig:
     """Qdrant 컬렉션 설정"""
 
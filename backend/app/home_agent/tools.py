@@ -274,9 +274,9 @@ def create_tools(user_id: int, law_firm_id: int):
             limit: 반환할 결과 수 (기본값: 5)
         """
         try:
-            from app.services.precedent_search_service import PrecedentSearchService
+            from app.services.precedent_search_service import get_precedent_search_service
 
-            service = PrecedentSearchService()
+            service = get_precedent_search_service()
             result = service.search_cases(query=query, limit=limit)
 
             items = result.get("results", [])
@@ -469,9 +469,9 @@ def create_tools(user_id: int, law_firm_id: int):
             limit: 반환할 결과 수 (기본값: 8)
         """
         try:
-            from app.services.search_laws_service import SearchLawsService
+            from app.services.search_laws_service import get_search_laws_service
 
-            service = SearchLawsService()
+            service = get_search_laws_service()
 
             # 특정 조문 패턴 감지: "형법 제307조", "민법 750조" 등
             article_pattern = re.match(
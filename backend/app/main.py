@@ -1,5 +1,7 @@
 import logging
+import logging.handlers
 import os
+import queue
 import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
@@ -15,9 +17,33 @@ from app.models.precedent import Precedent, PrecedentSummary  # 판례 원문 
 from app.config import EmbeddingConfig
 
 # 로깅 설정
+# 요청 처리 스레드/이벤트 루프는 QueueHandler로 레코드만 넘기고,
+# 포맷팅 + stdout 쓰기는 QueueListener 백그라운드 스레드에서 처리
+
+
+class _DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """레코드를 포맷팅하지 않고 그대로 큐에 넣는 QueueHandler
+
+    기본 QueueHandler.prepare()는 로그를 남기는 스레드에서 self.format(record)를 실행하므로
+    포맷팅(메시지 % 인자, 예외 traceback 문자열화)을 리스너 스레드의 핸들러로 미룸
+    (같은 프로세스 내 큐라 레코드를 pickle 가능하게 만들 필요 없음)
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_log_queue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler, respect_handler_level=True)
+_log_listener.start()
+
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    handlers=[_DeferredFormatQueueHandler(_log_queue)],
 )
 
 logger = logging.getLogger(__name__)
@@ -53,13 +79,22 @@ async def lifespan(app: FastAPI):
     if is_reranking_enabled():
         logger.info("서버 시작: 리랭커 모델 warm-up 중...")
         try:
-            get_reranker_model()
+            # 로드만으로는 ONNX 세션/커널 초기화가 첫 요청으로 밀리므로 더미 추론 1회 실행
+            get_reranker_model().predict([("warm-up", "warm-up")])
             logger.info("리랭커 모델 warm-up 완료")
         except Exception as e:
             logger.warning(f"리랭커 warm-up 실패 (첫 요청 시 로드됨): {e}")
     else:
         logger.info("서버 시작: 리랭킹 비활성 (USE_RERANKING=false)")
 
+    # BM25 Sparse 모델 warm-up (판례/법령 검색 공통)
+    from app.services.precedent_embedding_service import embed_sparse
+    try:
+        embed_sparse(["warm-up"])
+        logger.info("BM25 Sparse 모델 warm-up 완료")
+    except Exception as e:
+        logger.warning(f"BM25 Sparse 모델 warm-up 실패 (첫 요청 시 로드됨): {e}")
+
     # HF API 모드일 때만 워밍업 핑 시작
     if EmbeddingConfig.PRECEDENT_EMBEDDING == "kure_api":
         logger.info(f"HF API 워밍업 핑 시작 (간격: {EmbeddingConfig.WARMUP_INTERVAL_MINUTES}분)")
@@ -88,6 +123,7 @@ async def lifespan(app: FastAPI):
     # Agent checkpointer 종료
     await close_checkpointer()
     logger.info("서버 종료")
+    _log_listener.stop()  # 큐에 남은 로그 flush
 
 
 _debug = os.getenv("DEBUG", "").lower() in ("true", "1", "yes")
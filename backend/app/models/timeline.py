@@ -1,5 +1,6 @@
 from sqlalchemy import Column, BigInteger, Integer, String, Text, DateTime, ForeignKey, text
 from sqlalchemy.sql import func
+from datetime import datetime
 from tool.database import Base
 
 
@@ -44,3 +45,33 @@ class TimeLine(Base):
             "actor": self.actor or "",
             "order_index": self.order_index
         }
+
+
+class TimelineJob(Base):
+    """
+    타임라인 비동기 생성 작업 상태 테이블
+
+    여러 uvicorn 워커가 같은 작업 상태를 조회할 수 있도록 프로세스 메모리 대신 DB에 저장합니다.
+    """
+    __tablename__ = "timeline_jobs"
+
+    id = Column(String(32), primary_key=True)  # uuid4 hex
+    case_id = Column(BigInteger, ForeignKey('cases.id', ondelete='CASCADE'), nullable=False, index=True)
+    firm_id = Column(BigInteger, ForeignKey('law_firms.id', ondelete='SET NULL'), nullable=True)  # 조회 권한 확인용
+    status = Column(String(20), nullable=False, server_default="pending")  # pending | running | done | failed
+    count = Column(Integer, nullable=False, server_default="0")  # 생성된 타임라인 수
+    error = Column(Text, nullable=True)
+
+    # 메타 정보 (UTC, 작업 정체 판정용)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        """딕셔너리로 변환 (API 응답용, firm_id 제외)"""
+        return {
+            "job_id": self.id,
+            "case_id": f"CASE-{self.case_id:03d}",
+            "status": self.status,
+            "count": self.count or 0,
+            "error": self.error,
+        }
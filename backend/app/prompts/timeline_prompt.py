@@ -2,35 +2,18 @@
 타임라인 자동 생성을 위한 프롬프트
 """
 
-TIMELINE_GENERATION_PROMPT = """당신은 법률 사건의 타임라인을 분석하고 구조화하는 전문가입니다.
-
-다음 사건 정보를 바탕으로 시간순으로 발생한 주요 이벤트들을 타임라인으로 정리해주세요.
-
-## 사건 정보
-
-### 의뢰인 정보
-- 의뢰인 이름: {client_name}
-- 의뢰인 역할: {client_role}
-
-### 사건 요약
-{summary}
-
-### 사실관계
-{facts}
-
-### 청구 내용
-{claims}
-
-### 증거 목록
-{evidence_list}
+# 고정 지침/형식/예시 → system 메시지 (요청마다 바이트 단위로 동일 → OpenAI 프롬프트 캐싱 대상)
+# 주의: 내용을 요청별로 바꾸면 캐시 프리픽스가 깨지므로 사건별 데이터는 TIMELINE_USER_PROMPT에만 넣을 것
+TIMELINE_SYSTEM_PROMPT = """당신은 법률 사건의 타임라인을 분석하고 구조화하는 전문가입니다.
+사용자가 제공하는 사건 정보와 증거를 바탕으로 시간순으로 발생한 주요 이벤트들을 타임라인으로 정리하고, 각 이벤트와 관련된 주요 쟁점사항도 함께 분석해주세요.
 
 ## 작업 지침
 
-**중요: 의뢰인 "{client_name}"와 상대방을 명확히 구분하세요!**
+**중요: 사건 정보의 의뢰인과 상대방을 명확히 구분하세요!**
 - 의뢰인이 취한 행동 → type: "의뢰인"
 - 상대방(피고, 가해자 등)의 행동 → type: "상대방"
 
-1. 위 정보에서 **구체적인 날짜/시간 정보가 있는 이벤트**를 추출하세요
+1. 사건 정보에서 **구체적인 날짜/시간 정보가 있는 이벤트**를 추출하세요
 2. 날짜가 명시되지 않았지만 중요한 이벤트는 "날짜 미상"으로 표시하세요
 3. **증거 목록에 "증거 발생일"이 있으면 해당 날짜를 우선적으로 사용하세요**
 4. **증거 목록에 "증거 설명"이 있으면 이를 타임라인 description에 참고하세요**
@@ -41,7 +24,7 @@ TIMELINE_GENERATION_PROMPT = """당신은 법률 사건의 타임라인을 분
    - 법원문서: 소송 제기일, 결정일 등 절차적 날짜에 주목
    - 각 문서 유형에 맞는 법적 쟁점 파악
 6. 각 이벤트는 다음 기준으로 분류하세요:
-   - "의뢰인": **의뢰인 "{client_name}"**이 취한 행동 (예: 증거 수집, 고소 제기, 합의 제안 등)
+   - "의뢰인": **의뢰인**이 취한 행동 (예: 증거 수집, 고소 제기, 합의 제안 등)
    - "상대방": **상대방(피고소인/가해자)** 또는 **의뢰인이 아닌 다른 사람**의 행동
    - "증거": 증거 확보/발견 관련
    - "기타": 법률 상담, 소송 제기 등 기타 사건
@@ -57,19 +40,21 @@ TIMELINE_GENERATION_PROMPT = """당신은 법률 사건의 타임라인을 분
 
 ## 응답 형식
 
-반드시 아래 JSON 배열 형식으로만 응답하세요. 다른 설명이나 텍스트를 추가하지 마세요.
+반드시 아래 형식의 JSON 객체로만 응답하세요. 이벤트 목록은 "events" 배열에 담고, 다른 설명이나 텍스트를 추가하지 마세요.
 
 ```json
-[
-  {{
-    "date": "2025-11-15",
-    "time": "09:30",
-    "title": "이벤트 제목 (간단명료하게)",
-    "description": "구체적인 상황 설명 (누가, 무엇을, 어디서, 어떻게). [쟁점] 해당 이벤트와 관련된 법률적 쟁점사항 (성립 요건, 문제점 등)",
-    "type": "의뢰인" | "상대방" | "증거" | "기타",
-    "actor": "관련 인물명 또는 증거명"
-  }}
-]
+{
+  "events": [
+    {
+      "date": "2025-11-15",
+      "time": "09:30",
+      "title": "이벤트 제목 (간단명료하게)",
+      "description": "구체적인 상황 설명 (누가, 무엇을, 어디서, 어떻게). [쟁점] 해당 이벤트와 관련된 법률적 쟁점사항 (성립 요건, 문제점 등)",
+      "type": "의뢰인" | "상대방" | "증거" | "기타",
+      "actor": "관련 인물명 또는 증거명"
+    }
+  ]
+}
 ```
 
 ## 날짜 형식 규칙
@@ -86,51 +71,73 @@ TIMELINE_GENERATION_PROMPT = """당신은 법률 사건의 타임라인을 분
 - 증거 설명: 피고소인이 단톡방에서 의뢰인을 비방한 대화 내용
 
 ```json
-{{
+{
   "date": "2025-11-15",
   "time": "00:00",
   "title": "단톡방 비방 대화 발생",
   "description": "피고소인이 단톡방에서 의뢰인을 비방한 대화가 발생함. [쟁점] 명예훼손죄의 공연성 요건 충족 여부",
   "type": "상대방",
   "actor": "피고소인"
-}}
+}
 ```
 
 **상대방 행동 (카카오톡 발언)**
 ```json
-{{
+{
   "date": "2025-11-15",
   "time": "09:30",
   "title": "단톡방 비방 발언",
   "description": "피고소인 박OO가 34명 단체 카카오톡 채팅방에서 의뢰인에 대해 '업무능력이 없다'는 발언을 함 (카카오톡 대화 캡처본 확인). [쟁점] 명예훼손죄의 '사실 적시' 요건 충족 여부 및 '공연성' 성립 여부 (다수가 인식할 수 있는 상태)",
   "type": "상대방",
   "actor": "박OO (피고소인)"
-}}
+}
 ```
 
 **증거: 계약서**
 ```json
-{{
+{
   "date": "2025-01-10",
   "time": "14:00",
   "title": "근로계약서 체결",
   "description": "의뢰인과 회사 간 근로계약서 체결. 계약서상 월급 300만원, 주 5일 근무 조건 명시 (근로계약서 원본 보관). [쟁점] 계약서의 효력 및 근로기준법 준수 여부",
   "type": "기타",
   "actor": "회사, 의뢰인"
-}}
+}
 ```
 
 **증거: 영수증**
 ```json
-{{
+{
   "date": "2025-02-15",
   "time": "00:00",
   "title": "손해배상금 지급",
   "description": "피고가 원고에게 손해배상금 500만원을 현금으로 지급함 (영수증 및 거래명세서 보관). [쟁점] 지급 사실의 입증 및 채무 이행 완료 여부",
   "type": "상대방",
   "actor": "피고"
-}}
+}
 ```
+"""
+
+# 사건별 동적 데이터 → user 메시지 (프롬프트 끝에 배치)
+TIMELINE_USER_PROMPT = """## 사건 정보
+
+### 의뢰인 정보
+- 의뢰인 이름: {client_name}
+- 의뢰인 역할: {client_role}
+
+### 사건 요약
+{summary}
+
+### 사실관계
+{facts}
+
+### 청구 내용
+{claims}
+
+### 증거 목록
+{evidence_list}
+
+**의뢰인: "{client_name}"** - 의뢰인의 행동은 "의뢰인", 상대방의 행동은 "상대방"으로 분류하세요.
 
 이제 위 사건 정보를 바탕으로 타임라인 JSON을 생성해주세요:
 """
@@ -145,7 +152,7 @@ def create_timeline_prompt(
     client_role: str = "원고"
 ) -> str:
     """
-    타임라인 생성 프롬프트 생성
+    타임라인 생성 user 프롬프트 생성 (system 메시지는 TIMELINE_SYSTEM_PROMPT 사용)
 
     Args:
         summary: 사건 요약
@@ -156,9 +163,9 @@ def create_timeline_prompt(
         client_role: 의뢰인 역할 (원고/피고 등)
 
     Returns:
-        완성된 프롬프트
+        사건 정보가 채워진 user 프롬프트
     """
-    return TIMELINE_GENERATION_PROMPT.format(
+    return TIMELINE_USER_PROMPT.format(
         client_name=client_name or "의뢰인",
         client_role=client_role or "원고",
         summary=summary or "없음",
@@ -8,9 +8,11 @@ import os
 import logging
 import threading
 import time
-from typing import List, Tuple
-from functools import lru_cache
+from typing import List, Tuple, Callable
+from collections import OrderedDict
+from functools import wraps
 from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from openai import OpenAI
 from qdrant_client.http import models
 from fastembed import SparseTextEmbedding
@@ -47,6 +49,7 @@ _sparse_model = None
 _openai_client = None
 _kure_model = None
 _sparse_lock = threading.Lock()
+_sparse_embed_lock = threading.Lock()  # ONNX 세션 공유 시 embed() 직렬화
 _openai_lock = threading.Lock()
 _kure_lock = threading.Lock()
 
@@ -57,11 +60,22 @@ def get_sparse_model():
     if _sparse_model is None:
         with _sparse_lock:
             if _sparse_model is None:
-                logger.info("Sparse 임베딩 모델 로딩 중...")
-                _sparse_model = SparseTextEmbedding(model_name="Qdrant/bm25")
+                logger.info(f"Sparse 임베딩 모델 로딩 중... (threads={EmbeddingConfig.SPARSE_THREADS})")
+                _sparse_model = SparseTextEmbedding(
+                    model_name="Qdrant/bm25",
+                    threads=EmbeddingConfig.SPARSE_THREADS,
+                    providers=["CPUExecutionProvider"],
+                )
     return _sparse_model
 
 
+def embed_sparse(texts: List[str]) -> list:
+    """공유 Sparse 모델로 BM25 임베딩 (thread-safe)"""
+    model = get_sparse_model()
+    with _sparse_embed_lock:
+        return list(model.embed(texts))
+
+
 def get_openai_client():
     """OpenAI 클라이언트 싱글톤 (thread-safe)"""
     global _openai_client
@@ -85,29 +99,114 @@ def get_kure_model():
     return _kure_model
 
 
+# ==================== 임베딩 캐시 (INT8 양자화) ====================
+
+EMBEDDING_CACHE_SIZE = 5000  # float 튜플 대비 1/4 이하 메모리 → 캐시 용량 확대
+
+
+class QuantizedEmbeddingCache:
+    """
+    Dense 임베딩 LRU 캐시 (thread-safe)
+    - 벡터를 INT8 + 벡터별 scale로 저장 (1024차원 기준 약 1KB)
+    - 조회 시 float 리스트로 복원 (캐시 히트만 근사 벡터, 저장용 임베딩은 캐시 없는 함수 사용)
+    """
+
+    def __init__(self, maxsize: int = EMBEDDING_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _quantize(vector) -> Tuple[bytes, float]:
+        arr = np.asarray(vector, dtype=np.float32)
+        max_abs = float(np.max(np.abs(arr))) if arr.size else 0.0
+        scale = max_abs / 127.0 if max_abs > 0 else 1.0
+        quantized = np.clip(np.rint(arr / scale), -127, 127).astype(np.int8)
+        return quantized.tobytes(), scale
+
+    @staticmethod
+    def _dequantize(buf: bytes, scale: float) -> List[float]:
+        return (np.frombuffer(buf, dtype=np.int8).astype(np.float32) * scale).tolist()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            self._data.move_to_end(key)
+        return self._dequantize(*entry)
+
+    def put(self, key, vector) -> None:
+        entry = self._quantize(vector)
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_KWARGS_MARK = object()  # 캐시 키에서 위치 인자와 키워드 인자 구분용
+
+
+def quantized_embedding_cache(maxsize: int = EMBEDDING_CACHE_SIZE) -> Callable:
+    """임베딩 함수용 INT8 캐시 데코레이터 (lru_cache 대체, 인자 튜플을 키로 사용)
+
+    캐시 미스는 원본 float 벡터를 그대로 반환하고, 캐시에는 양자화한 사본만 저장
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = QuantizedEmbeddingCache(maxsize)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> List[float]:
+            key = args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            vector = func(*args, **kwargs)
+            cache.put(key, vector)
+            return vector
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
 # ==================== 캐싱된 임베딩 함수 ====================
 
-@lru_cache(maxsize=500)
-def create_openai_embedding_cached(text: str, model: str = "text-embedding-3-small") -> Tuple[float, ...]:
-    """OpenAI Dense 임베딩 생성 (캐싱됨)"""
+def create_openai_embedding(text: str, model: str = "text-embedding-3-small") -> List[float]:
+    """OpenAI Dense 임베딩 생성 (캐시 없음, 원본 정밀도 - Qdrant 저장용)"""
     client = get_openai_client()
     response = client.embeddings.create(
         model=model,
         input=text
     )
-    return tuple(response.data[0].embedding)
+    return response.data[0].embedding
+
+
+@quantized_embedding_cache()
+def create_openai_embedding_cached(text: str, model: str = "text-embedding-3-small") -> List[float]:
+    """OpenAI Dense 임베딩 생성 (캐싱됨, 캐시 히트는 INT8 근사 벡터 - 검색 쿼리용)"""
+    return create_openai_embedding(text, model)
 
 
-@lru_cache(maxsize=500)
-def create_kure_local_embedding_cached(text: str) -> Tuple[float, ...]:
+@quantized_embedding_cache()
+def create_kure_local_embedding_cached(text: str) -> List[float]:
     """KURE Dense 임베딩 생성 - 로컬 모델 (캐싱됨)"""
     model = get_kure_model()
     embedding = model.encode(text, normalize_embeddings=True)
-    return tuple(embedding.tolist())
+    return embedding.tolist()
 
 
-@lru_cache(maxsize=500)
-def create_kure_api_embedding_cached(text: str) -> Tuple[float, ...]:
+@quantized_embedding_cache()
+def create_kure_api_embedding_cached(text: str) -> List[float]:
     """KURE Dense 임베딩 생성 - HF InferenceClient (캐싱됨)"""
     max_retries = 3
     retry_delay = 2
@@ -121,13 +220,13 @@ def create_kure_api_embedding_cached(text: str) -> Tuple[float, ...]:
             )
             # 결과가 리스트 형태로 반환됨
             if hasattr(embedding, 'tolist'):
-                return tuple(embedding.tolist())
-            elif isinstance(embedding, list):
+                embedding = embedding.tolist()
+            if isinstance(embedding, list):
                 # [[...]] 또는 [...] 형태
                 if len(embedding) > 0 and isinstance(embedding[0], list):
-                    return tuple(embedding[0])
-                return tuple(embedding)
-            return tuple(embedding)
+                    return embedding[0]
+                return embedding
+            return list(embedding)
 
         except Exception as e:
             error_msg = str(e)
@@ -231,7 +330,7 @@ class PrecedentEmbeddingService:
         Returns:
             Qdrant SparseVector
         """
-        sparse_emb = list(self.sparse_model.embed([text]))[0]
+        sparse_emb = embed_sparse([text])[0]
         return models.SparseVector(
             indices=sparse_emb.indices.tolist(),
             values=sparse_emb.values.tolist(),
@@ -240,6 +339,7 @@ class PrecedentEmbeddingService:
     def create_both_parallel(self, text: str) -> Tuple[List[float], models.SparseVector]:
         """
         Dense + Sparse 임베딩 병렬 생성
+        - Dense(API 대기)만 executor에 제출, Sparse(로컬 BM25)는 대기 중 현재 스레드에서 실행
 
         Args:
             text: 임베딩할 텍스트
@@ -248,8 +348,8 @@ class PrecedentEmbeddingService:
             (dense_vector, sparse_vector) 튜플
         """
         dense_future = self.executor.submit(self.create_dense, text)
-        sparse_future = self.executor.submit(self.create_sparse, text)
-        return dense_future.result(), sparse_future.result()
+        sparse_vector = self.create_sparse(text)
+        return dense_future.result(), sparse_vector
 
     # ==================== 배치 임베딩 ====================
 
@@ -297,7 +397,7 @@ class PrecedentEmbeddingService:
         if not texts:
             return []
 
-        sparse_embeddings = list(self.sparse_model.embed(texts))
+        sparse_embeddings = embed_sparse(texts)
         return [
             models.SparseVector(
                 indices=emb.indices.tolist(),
@@ -4,18 +4,29 @@ Prefetch + RRF 1회 호출 + Python 우선순위 부스팅
 """
 
 import re
+import copy
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Set, Optional
 from qdrant_client.http import models
 
 from app.services.precedent_embedding_service import PrecedentEmbeddingService
 from app.services.precedent_repository import PrecedentRepository, SearchResult
-from app.config import CollectionConfig, QuantizationConfig
+from app.config import CollectionConfig, QuantizationConfig, HnswConfig
+from tool.ttl_cache import TTLCache, make_cache_key
 
 logger = logging.getLogger(__name__)
 
 
+# ==================== 검색 결과 캐시 (프로세스 내 TTL) ====================
+
+SEARCH_CACHE_TTL = 300    # 초
+SEARCH_CACHE_SIZE = 256   # 최대 엔트리 수
+
+_search_cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+
+
 class PrecedentSearchService:
     """판례 검색 서비스 (Prefetch + RRF + Python 부스팅)"""
 
@@ -281,7 +292,7 @@ class PrecedentSearchService:
             collection_name=self.CASES_COLLECTION,
             scroll_filter=scroll_filter,
             limit=limit * 5,
-            with_payload=True,
+            with_payload=["case_number"],  # 메타데이터는 PostgreSQL에서 조회하므로 사건번호만
             with_vectors=False,
         )
 
@@ -386,6 +397,30 @@ class PrecedentSearchService:
         """
         query = query.strip()
 
+        # 동일 검색 요청은 TTL 동안 캐시된 결과 반환 (임베딩 + Qdrant + PostgreSQL 생략)
+        cache_key = make_cache_key(
+            query=query, limit=limit, offset=offset, sort=sort,
+            merge_chunks=merge_chunks, filters=filters,
+        )
+        # results 리스트/판례 dict까지 캐시와 공유하지 않도록 깊은 복사로 반환 (호출 측 수정이 캐시를 오염시키지 않음)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"검색 캐시 히트: '{query}'")
+            return copy.deepcopy(cached)
+
+        result = self._search_cases(query, limit, offset, sort, filters)
+        _search_cache.put(cache_key, result)
+        return copy.deepcopy(result)
+
+    def _search_cases(
+        self,
+        query: str,
+        limit: int,
+        offset: int,
+        sort: str,
+        filters: Optional[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """search_cases 본체 (캐시 미적용)"""
         # 사건번호 패턴
         if self._is_case_number(query):
             return self._search_by_case_number(query, limit)
@@ -401,28 +436,29 @@ class PrecedentSearchService:
         # offset + limit + 1 만큼 검색 (has_more 판단용, 중복 제거 고려해 여유있게)
         internal_limit = (offset + limit + 1) * 3
 
-        # 양자화 컬렉션용 search_params 설정
-        search_params = None
-        if QuantizationConfig.ENABLED:
-            search_params = models.SearchParams(
-                quantization=models.QuantizationSearchParams(
-                    rescore=QuantizationConfig.RESCORE,
-                    oversampling=QuantizationConfig.OVERSAMPLING,
-                )
-            )
+        # Dense prefetch용 search_params 설정
+        # - hnsw_ef: limit에 맞춰 탐색 폭 조정 (기본 128 대신 최소 HnswConfig.EF)
+        # - 양자화 컬렉션: INT8로 탐색 후 원본 벡터로 rescore
+        # Fusion 쿼리에서는 최상위 search_params가 prefetch에 적용되지 않으므로 prefetch에 직접 지정
+        dense_params = models.SearchParams(
+            hnsw_ef=max(HnswConfig.EF, internal_limit),
+            quantization=models.QuantizationSearchParams(
+                rescore=QuantizationConfig.RESCORE,
+                oversampling=QuantizationConfig.OVERSAMPLING,
+            ) if QuantizationConfig.ENABLED else None,
+        )
 
         # ★ Qdrant API 1회: Prefetch + RRF Fusion
         results = self.repository.qdrant_client.query_points(
             collection_name=self.CASES_COLLECTION,
             prefetch=[
-                models.Prefetch(query=dense_vec, using="dense", limit=internal_limit),
+                models.Prefetch(query=dense_vec, using="dense", limit=internal_limit, params=dense_params),
                 models.Prefetch(query=sparse_vec, using="sparse", limit=internal_limit),
             ],
             query=models.FusionQuery(fusion=models.Fusion.RRF),
             query_filter=query_filter,
             limit=internal_limit,
             with_payload=["case_number", "section"],  # 최소 payload만 요청
-            search_params=search_params,
         )
 
         # 사건번호별 중복 제거 (섹션 가중치만 적용)
@@ -510,3 +546,19 @@ class PrecedentSearchService:
 
     async def get_case_detail_with_fallback(self, case_number: str) -> Dict[str, Any] | None:
         return await self.repository.get_case_detail_with_fallback(case_number)
+
+
+# ==================== 서비스 싱글톤 ====================
+
+_precedent_search_service = None
+_precedent_search_service_lock = threading.Lock()
+
+
+def get_precedent_search_service() -> PrecedentSearchService:
+    """PrecedentSearchService 싱글톤 (thread-safe)"""
+    global _precedent_search_service
+    if _precedent_search_service is None:
+        with _precedent_search_service_lock:
+            if _precedent_search_service is None:
+                _precedent_search_service = PrecedentSearchService()
+    return _precedent_search_service
@@ -7,18 +7,23 @@
 """
 
 import os
+import copy
 import time
+import heapq
 import logging
+import threading
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
 from qdrant_client.http import models
 from qdrant_client.models import Filter, FieldCondition, MatchAny
 
 from app.services.precedent_embedding_service import PrecedentEmbeddingService, get_openai_client
 from app.services.precedent_repository import PrecedentRepository
-from app.config import CollectionConfig, QuantizationConfig
+from app.config import CollectionConfig, QuantizationConfig, HnswConfig, RerankerConfig
 from tool.qdrant_client import get_qdrant_client
+from tool.ttl_cache import TTLCache, make_cache_key
 from app.prompts.query_transform_prompt import (
     QUERY_TRANSFORM_V5_SYSTEM,
     QUERY_TRANSFORM_V5_USER,
@@ -33,10 +38,69 @@ def is_reranking_enabled() -> bool:
     return os.getenv("USE_RERANKING", "false").lower() in ("true", "1", "yes")
 
 
+# GPT 쿼리 정제 결과 캐시 (동일 쿼리 반복 시 GPT 호출 생략)
+REFINE_CACHE_TTL = 3600   # 초
+REFINE_CACHE_SIZE = 2048  # 최대 엔트리 수
+
+_refine_cache = TTLCache(maxsize=REFINE_CACHE_SIZE, ttl=REFINE_CACHE_TTL)
+
+# 2단계 검색(BM25 → Dense) 결과 캐시 (Qdrant 왕복 생략)
+RETRIEVAL_CACHE_TTL = 600  # 초 (재색인 반영 지연 상한)
+RETRIEVAL_CACHE_SIZE = 512  # 최대 엔트리 수
+
+_retrieval_cache = TTLCache(maxsize=RETRIEVAL_CACHE_SIZE, ttl=RETRIEVAL_CACHE_TTL)
+
+# 쿼리 Dense 임베딩 전용 executor (API 응답 대기 위주)
+# 공용 get_executor()(워커 2개)를 쓰면 법령 검색 임베딩과 줄서게 되므로
+# 요청 처리 스레드풀(AnyIO 기본 40)과 같은 크기로 별도 운영
+DENSE_EXECUTOR_WORKERS = 40
+
+_dense_executor = None
+_dense_executor_lock = threading.Lock()
+
+
+def _get_dense_executor() -> ThreadPoolExecutor:
+    """쿼리 Dense 임베딩 전용 ThreadPoolExecutor 싱글톤 (thread-safe)"""
+    global _dense_executor
+    if _dense_executor is None:
+        with _dense_executor_lock:
+            if _dense_executor is None:
+                _dense_executor = ThreadPoolExecutor(
+                    max_workers=DENSE_EXECUTOR_WORKERS, thread_name_prefix="similar-dense"
+                )
+    return _dense_executor
+
+
 # 리랭커 모델 (Lazy Loading)
 _reranker_model = None
 
 
+def _load_onnx_reranker():
+    """
+    ONNX Runtime 백엔드 + int8 동적 양자화 리랭커 로드
+    - 최초 부팅 시 ONNX export → 양자화 → 캐시 디렉토리 저장
+    - 이후 부팅은 캐시 디렉토리에서 바로 로드
+    """
+    from sentence_transformers import CrossEncoder, export_dynamic_quantized_onnx_model
+
+    cache_dir = RerankerConfig.ONNX_CACHE_DIR
+    file_name = f"model_qint8_{RerankerConfig.ONNX_QUANTIZATION}.onnx"
+    model_kwargs = {"provider": "CPUExecutionProvider"}
+
+    if not os.path.exists(os.path.join(cache_dir, "onnx", file_name)):
+        logger.info(f"리랭커 ONNX 양자화 모델 생성 중... ({RerankerConfig.ONNX_QUANTIZATION})")
+        model = CrossEncoder(RerankerConfig.MODEL, max_length=RerankerConfig.MAX_LENGTH, backend="onnx", model_kwargs=model_kwargs)
+        model.save_pretrained(cache_dir)
+        export_dynamic_quantized_onnx_model(model, RerankerConfig.ONNX_QUANTIZATION, cache_dir)
+
+    return CrossEncoder(
+        cache_dir,
+        max_length=RerankerConfig.MAX_LENGTH,
+        backend="onnx",
+        model_kwargs={**model_kwargs, "file_name": f"onnx/{file_name}"},
+    )
+
+
 def get_reranker_model():
     """리랭커 모델 싱글톤 로드. 리랭킹 비활성 시 None 반환."""
     if not is_reranking_enabled():
@@ -44,8 +108,18 @@ def get_reranker_model():
     global _reranker_model
     if _reranker_model is None:
         from sentence_transformers import CrossEncoder
-        logger.info("리랭커 모델 로딩 중... (BAAI/bge-reranker-v2-m3)")
-        _reranker_model = CrossEncoder("BAAI/bge-reranker-v2-m3", max_length=4096)
+        logger.info(f"리랭커 모델 로딩 중... ({RerankerConfig.MODEL}, backend={RerankerConfig.BACKEND})")
+        if RerankerConfig.BACKEND == "onnx":
+            try:
+                _reranker_model = _load_onnx_reranker()
+            except Exception as e:
+                logger.warning(f"ONNX 리랭커 로드 실패, PyTorch 백엔드로 폴백: {e}")
+        if _reranker_model is None:
+            _reranker_model = CrossEncoder(RerankerConfig.MODEL, max_length=RerankerConfig.MAX_LENGTH)
+            if RerankerConfig.TORCH_BF16:
+                import torch
+                _reranker_model.model.to(dtype=torch.bfloat16)
+                logger.info("리랭커 bfloat16 추론 활성화")
         logger.info("리랭커 모델 로드 완료")
     return _reranker_model
 
@@ -90,6 +164,9 @@ class PrecedentSimilarService:
     # 검색/리랭킹 설정
     SEARCH_LIMIT = 50  # 각 검색(Dense/Sparse)에서 가져올 수
     RERANK_CANDIDATES = 30  # 리랭킹할 판례 후보 수
+    RERANK_BATCH_SIZE = 32  # Cross-encoder predict 배치 크기
+    RERANK_QUERY_MAX_CHARS = 500  # 리랭크 쿼리 최대 글자 수 (긴 쿼리가 청크의 토큰 예산을 차지하지 않도록)
+    SHORT_QUERY_LENGTH = 30  # 이보다 짧은 쿼리는 GPT 정제 생략
 
     def __init__(self, use_reranking: bool | None = None):
         self.embedding_service = PrecedentEmbeddingService(
@@ -114,6 +191,13 @@ class PrecedentSimilarService:
         """
         import json
 
+        # 공백만 다른 동일 쿼리는 같은 키로 취급
+        cache_key = make_cache_key(query=" ".join(user_query.split()))
+        cached = _refine_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"[유사 판례 검색] 쿼리 정제 캐시 히트: {cached['query'][:100]}...")
+            return {"query": cached["query"], "keywords": list(cached["keywords"])}
+
         try:
             logger.info("=" * 60)
             logger.info("[유사 판례 검색] GPT 쿼리 정제 + 키워드 추출 (V5)")
@@ -148,10 +232,13 @@ class PrecedentSimilarService:
             if not query:
                 query = self._minimal_clean(user_query)
 
-            return {
+            result = {
                 "query": query,
                 "keywords": keywords[:5]
             }
+            # GPT 성공 결과만 캐시 (폴백 결과는 다음 요청에서 재시도)
+            _refine_cache.put(cache_key, result)
+            return {"query": query, "keywords": list(result["keywords"])}
 
         except json.JSONDecodeError as e:
             logger.error(f"JSON 파싱 실패: {e}, 최소 정제 적용")
@@ -186,7 +273,7 @@ class PrecedentSimilarService:
     def _search_sparse_filter(self, keywords: List[str]) -> set:
         """
         1단계: BM25 (Sparse) 검색으로 키워드 매칭된 case_number 필터링
-        - 키워드별 개별 검색 후 결과 합치기
+        - 키워드별 검색을 query_batch_points 1회로 전송 후 결과 합치기
         - 점수 하한값 이상인 모든 결과를 가져옴
 
         Args:
@@ -199,23 +286,27 @@ class PrecedentSimilarService:
             logger.info("[BM25 필터] 키워드 없음, 필터링 스킵")
             return set()
 
-        # 키워드별 개별 검색 후 결과 합치기
-        all_case_numbers = set()
-        keyword_results = {}
-
-        for keyword in keywords:
-            sparse_vec = self.embedding_service.create_sparse(keyword)
-
-            # BM25 검색 (하한값 이상 모두 가져오기)
-            results = self.qdrant_client.query_points(
-                collection_name=self.COLLECTION_PRECEDENTS,
+        # 키워드별 검색을 1회 배치 RPC로 전송 후 결과 합치기
+        sparse_vecs = self.embedding_service.create_sparse_batch(keywords)
+        requests = [
+            models.QueryRequest(
                 query=sparse_vec,
                 using="sparse",
-                score_threshold=self.SPARSE_SCORE_THRESHOLD,
+                score_threshold=self.SPARSE_SCORE_THRESHOLD,  # 하한값 이상 모두 가져오기
                 limit=self.SPARSE_MAX_LIMIT,
                 with_payload=["case_number"],
             )
+            for sparse_vec in sparse_vecs
+        ]
+        batch_results = self.qdrant_client.query_batch_points(
+            collection_name=self.COLLECTION_PRECEDENTS,
+            requests=requests,
+        )
+
+        all_case_numbers = set()
+        keyword_results = {}
 
+        for keyword, results in zip(keywords, batch_results):
             # case_number 추출
             case_numbers = set()
             for point in results.points:
@@ -232,20 +323,19 @@ class PrecedentSimilarService:
 
     def _search_dense_filtered(
         self,
-        query: str,
+        dense_vec: List[float],
         case_numbers: set
     ) -> Dict[str, Dict[str, Any]]:
         """
         2단계: 필터링된 case_number 내에서 Dense 검색
 
         Args:
-            query: 정제된 쿼리
+            dense_vec: 정제된 쿼리의 Dense 임베딩
             case_numbers: BM25로 필터링된 case_number set
 
         Returns:
             {chunk_id: {"score": float, "payload": dict}}
         """
-        dense_vec = self.embedding_service.create_dense(query)
 
         # case_number 필터 생성
         search_filter = None
@@ -260,15 +350,14 @@ class PrecedentSimilarService:
             )
 
         # Dense 검색 (필터 적용)
-        # 양자화 컬렉션용 search_params 설정
-        search_params = None
-        if QuantizationConfig.ENABLED:
-            search_params = models.SearchParams(
-                quantization=models.QuantizationSearchParams(
-                    rescore=QuantizationConfig.RESCORE,
-                    oversampling=QuantizationConfig.OVERSAMPLING,
-                )
-            )
+        # search_params: limit 기반 hnsw_ef + 양자화 컬렉션용 rescore
+        search_params = models.SearchParams(
+            hnsw_ef=max(HnswConfig.EF, self.SEARCH_LIMIT),
+            quantization=models.QuantizationSearchParams(
+                rescore=QuantizationConfig.RESCORE,
+                oversampling=QuantizationConfig.OVERSAMPLING,
+            ) if QuantizationConfig.ENABLED else None,
+        )
 
         results = self.qdrant_client.query_points(
             collection_name=self.COLLECTION_PRECEDENTS,
@@ -276,17 +365,16 @@ class PrecedentSimilarService:
             using="dense",
             query_filter=search_filter,
             limit=self.SEARCH_LIMIT,
-            with_payload=["case_number", "section"],
+            with_payload=["case_number"],  # 그룹핑에 case_number만 사용
+            with_vectors=False,
             search_params=search_params,
         )
 
-        chunk_scores = {}
-        for point in results.points:
-            chunk_id = str(point.id)
-            chunk_scores[chunk_id] = {
-                "score": point.score,
-                "payload": point.payload,
-            }
+        # point.id(UUID 문자열/정수)를 그대로 키로 사용 - 그룹핑에서 키 값은 쓰지 않음
+        chunk_scores = {
+            point.id: {"score": point.score, "payload": point.payload}
+            for point in results.points
+        }
 
         filter_info = f"필터: {len(case_numbers)}개 판례" if case_numbers else "필터 없음"
         logger.info(f"[Dense 검색] {filter_info} → {len(chunk_scores)}개 청크")
@@ -307,6 +395,23 @@ class PrecedentSimilarService:
         Returns:
             {chunk_id: {"score": float, "payload": dict}}
         """
+        # 동일 (쿼리, 키워드, 컬렉션) 조합은 캐시된 청크 결과 반환
+        # 임베딩/BM25는 대소문자·공백을 구분하므로 쿼리와 키워드는 검색에 쓰는 값 그대로 키로 사용
+        cache_key = make_cache_key(
+            query=query,
+            keywords=list(keywords),
+            limit=self.SEARCH_LIMIT,
+            collection=self.COLLECTION_PRECEDENTS,
+        )
+        cached = _retrieval_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"[2단계 검색] 캐시 히트 → {len(cached)}개 청크")
+            # 호출 측 수정이 캐시를 오염시키지 않도록 복사본 반환
+            return copy.deepcopy(cached)
+
+        # Dense 임베딩(HF/OpenAI API)은 BM25 필터와 무관 → 백그라운드에서 동시 생성
+        dense_future = _get_dense_executor().submit(self.embedding_service.create_dense, query)
+
         # 1단계: BM25로 키워드 매칭 판례 필터링
         case_numbers = self._search_sparse_filter(keywords)
 
@@ -315,8 +420,9 @@ class PrecedentSimilarService:
             logger.info("[2단계 검색] BM25 매칭 없음, 전체 Dense 검색으로 폴백")
 
         # 2단계: 필터링된 판례에서 Dense 검색
-        chunk_scores = self._search_dense_filtered(query, case_numbers)
+        chunk_scores = self._search_dense_filtered(dense_future.result(), case_numbers)
 
+        _retrieval_cache.put(cache_key, copy.deepcopy(chunk_scores))
         return chunk_scores
 
     # ==================== 청크 → 판례 그룹핑 ====================
@@ -325,18 +431,16 @@ class PrecedentSimilarService:
         self,
         chunk_scores: Dict[str, Dict[str, Any]],
         exclude_case_number: Optional[str] = None,
-        query: str = ""
     ) -> List[Dict[str, Any]]:
         """
         청크 검색 결과를 판례 단위로 그룹핑
 
-        - RRF 점수 기반 정렬
-        - PostgreSQL에서 메타데이터 + 전문 조회
-        - 미리보기 추출
+        - 판례별 Dense 최고 점수(max_score) 집계 (정렬하지 않음)
+        - 메타데이터/미리보기는 _attach_metadata에서 상위 후보에만 채움
         """
         cases = {}
 
-        for chunk_id, data in chunk_scores.items():
+        for data in chunk_scores.values():
             case_number = data["payload"].get("case_number", "")
             if not case_number:
                 continue
@@ -345,8 +449,10 @@ class PrecedentSimilarService:
             if exclude_case_number and case_number == exclude_case_number:
                 continue
 
-            if case_number not in cases:
-                cases[case_number] = {
+            # 판례 엔트리는 1회 조회 후 참조 재사용
+            case = cases.get(case_number)
+            if case is None:
+                case = cases[case_number] = {
                     "case_number": case_number,
                     "case_name": "",
                     "court_name": "",
@@ -357,34 +463,38 @@ class PrecedentSimilarService:
                 }
 
             score = data["score"]
-            cases[case_number]["chunk_count"] += 1
+            case["chunk_count"] += 1
 
             # 가장 높은 점수 기록
-            if score > cases[case_number]["max_score"]:
-                cases[case_number]["max_score"] = score
+            if score > case["max_score"]:
+                case["max_score"] = score
 
-        # PostgreSQL에서 메타데이터 + 전문 일괄 조회
-        case_numbers = list(cases.keys())
-        if case_numbers:
-            metadata_batch = self.repository.get_metadata_batch(case_numbers)
-            for case_number, case_data in cases.items():
-                if case_number in metadata_batch:
-                    meta = metadata_batch[case_number]
-                    case_data["case_name"] = meta.get("case_name", "")
-                    case_data["court_name"] = meta.get("court_name", "")
-                    case_data["judgment_date"] = meta.get("judgment_date", "")
-
-                    # 미리보기 추출 (검색어 주변 텍스트)
-                    full_content = meta.get("full_content", "")
-                    if full_content:
-                        case_data["best_chunk"] = self.repository.extract_preview(
-                            full_content, query, context_chars=200
-                        )
-
-        # max_score 기준 정렬
-        sorted_cases = sorted(cases.values(), key=lambda x: x["max_score"], reverse=True)
-
-        return sorted_cases
+        # 정렬은 호출 측에서 필요한 상위 K개만 선택 (heapq.nlargest)
+        return list(cases.values())
+
+    def _attach_metadata(self, cases: List[Dict[str, Any]], query: str) -> None:
+        """
+        PostgreSQL에서 메타데이터 + 전문 일괄 조회 후 미리보기 추출 (in-place)
+        - 리랭킹/응답에 쓰이는 후보에만 호출 → full_content 전송량과 미리보기 추출 비용 절감
+        """
+        if not cases:
+            return
+
+        metadata_batch = self.repository.get_metadata_batch([c["case_number"] for c in cases])
+        for case_data in cases:
+            meta = metadata_batch.get(case_data["case_number"])
+            if meta is None:
+                continue
+            case_data["case_name"] = meta.get("case_name", "")
+            case_data["court_name"] = meta.get("court_name", "")
+            case_data["judgment_date"] = meta.get("judgment_date", "")
+
+            # 미리보기 추출 (검색어 주변 텍스트)
+            full_content = meta.get("full_content", "")
+            if full_content:
+                case_data["best_chunk"] = self.repository.extract_preview(
+                    full_content, query, context_chars=200
+                )
 
     # ==================== 리랭킹 ====================
 
@@ -405,26 +515,34 @@ class PrecedentSimilarService:
         if reranker is None:
             return candidates[:top_k]
 
-        # (쿼리, best_chunk) 쌍 생성
-        pairs = []
-        for c in candidates:
-            # best_chunk 1개를 온전히 사용 (최대 1500자)
-            best_chunk = c.get("best_chunk", "")[:1500]
-            pairs.append((query[:500], best_chunk))
-
-        # Cross-encoder로 점수 계산
-        scores = reranker.predict(pairs)
-
-        # 점수 기준 정렬
-        scored_candidates = [
-            (candidate, float(score))
-            for candidate, score in zip(candidates, scores)
-        ]
-        scored_candidates.sort(key=lambda x: x[1], reverse=True)
+        # (쿼리, best_chunk) 쌍 생성 - best_chunk 1개를 온전히 사용
+        # 실제 길이 제한은 토크나이저가 MAX_LENGTH 토큰 기준으로 적용, 청크 문자 슬라이스는 토큰화 비용 상한용
+        # (한국어는 토큰당 1~2자 → 토큰 예산의 2배 문자면 토크나이저보다 먼저 잘리지 않음)
+        # 쿼리는 별도로 짧게 제한해 토큰 예산 대부분을 청크에 남김
+        char_cap = RerankerConfig.MAX_LENGTH * 2
+        chunks = [c.get("best_chunk", "")[:char_cap] for c in candidates]
+        query = query[:self.RERANK_QUERY_MAX_CHARS]
+
+        # 길이순 정렬 후 배치 → 배치별 패딩 최소화
+        order = sorted(range(len(chunks)), key=lambda i: len(chunks[i]))
+        sorted_pairs = [(query, chunks[i]) for i in order]
+
+        # Cross-encoder로 점수 계산 후 원래 후보 순서로 복원
+        sorted_scores = reranker.predict(sorted_pairs, batch_size=self.RERANK_BATCH_SIZE)
+        scores = [0.0] * len(candidates)
+        for pos, idx in enumerate(order):
+            scores[idx] = sorted_scores[pos]
+
+        # 점수 기준 상위 top_k만 선택
+        scored_candidates = heapq.nlargest(
+            top_k,
+            ((candidate, float(score)) for candidate, score in zip(candidates, scores)),
+            key=lambda x: x[1],
+        )
 
         # 리랭크 점수 추가하여 반환
         reranked = []
-        for candidate, rerank_score in scored_candidates[:top_k]:
+        for candidate, rerank_score in scored_candidates:
             candidate["rerank_score"] = rerank_score
             candidate["final_score"] = rerank_score  # 단순화: 리랭크 점수 = 최종 점수
             reranked.append(candidate)
@@ -437,7 +555,8 @@ class PrecedentSimilarService:
         self,
         query: str,
         exclude_case_number: Optional[str] = None,
-        limit: int = 5
+        limit: int = 5,
+        transform: bool = True,
     ) -> Dict[str, Any]:
         """
         유사 판례 검색 (2단계: BM25 → Dense + 리랭킹)
@@ -453,6 +572,7 @@ class PrecedentSimilarService:
             query: 검색 쿼리
             exclude_case_number: 제외할 판례 사건번호
             limit: 반환할 유사 판례 수
+            transform: GPT 쿼리 정제 사용 여부 (False거나 짧은 쿼리면 생략)
 
         Returns:
             유사 판례 목록
@@ -464,9 +584,15 @@ class PrecedentSimilarService:
 
         # 1. GPT 쿼리 정제 + 키워드 추출 (V5 프롬프트)
         t1 = time.time()
-        extract_result = self._refine_and_extract(query)
-        refined_query = extract_result["query"]
-        keywords = extract_result["keywords"]
+        if transform and len(query.strip()) >= self.SHORT_QUERY_LENGTH:
+            extract_result = self._refine_and_extract(query)
+            refined_query = extract_result["query"]
+            keywords = extract_result["keywords"]
+        else:
+            # 짧은 쿼리: GPT 호출 없이 최소 정제 + 공백 단위 키워드 사용
+            refined_query = self._minimal_clean(query)
+            keywords = [w for w in refined_query.split() if len(w) >= 2][:5]
+            logger.info(f"[유사 판례 검색] 쿼리 정제 생략 (transform={transform}, 길이={len(query.strip())})")
         logger.info(f"[시간] 1. 쿼리 정제 + 키워드 추출: {time.time() - t1:.2f}초")
 
         # 2. 2단계 검색: BM25 필터링 → Dense 검색
@@ -475,15 +601,21 @@ class PrecedentSimilarService:
         logger.info(f"[시간] 2. 2단계 검색 (BM25→Dense): {time.time() - t2:.2f}초")
         logger.info(f"검색된 청크 수: {len(chunk_scores)}")
 
-        # 3. 청크 → 판례 그룹핑 (PostgreSQL에서 메타데이터 + 미리보기)
+        # 3. 청크 → 판례 그룹핑 후 사용할 후보에만 메타데이터 + 미리보기 조회 (PostgreSQL)
         t3 = time.time()
-        grouped_cases = self._group_by_case(chunk_scores, exclude_case_number, refined_query)
+        grouped_cases = self._group_by_case(chunk_scores, exclude_case_number)
+        # 전체 정렬 대신 max_score 상위 K개만 선택 - O(N log K)
+        top_candidates = heapq.nlargest(
+            self.RERANK_CANDIDATES if self.use_reranking else limit,
+            grouped_cases,
+            key=lambda x: x["max_score"],
+        )
+        self._attach_metadata(top_candidates, refined_query)
         logger.info(f"[시간] 3. 그룹핑: {time.time() - t3:.2f}초")
         logger.info(f"그룹핑된 판례 수: {len(grouped_cases)}")
 
         # 4. 리랭킹 (정제된 쿼리 사용)
-        if self.use_reranking and len(grouped_cases) > 0:
-            top_candidates = grouped_cases[:self.RERANK_CANDIDATES]
+        if self.use_reranking and len(top_candidates) > 0:
 
             # 리랭킹 후보 로그
             candidates_info = [
@@ -501,7 +633,7 @@ class PrecedentSimilarService:
             logger.info(f"[시간] 4. 리랭킹: {time.time() - t4:.2f}초")
             logger.info(f"리랭킹 적용: {len(top_candidates)}개 후보 → {limit}개 선정")
         else:
-            final_cases = grouped_cases[:limit]
+            final_cases = top_candidates
 
         logger.info(f"[시간] 전체: {time.time() - start_time:.2f}초")
 
@@ -546,3 +678,19 @@ class PrecedentSimilarService:
             "results": [r.to_dict() for r in results],
             "debug": debug_info,
         }
+
+
+# ==================== 서비스 싱글톤 ====================
+
+_precedent_similar_service = None
+_precedent_similar_service_lock = threading.Lock()
+
+
+def get_precedent_similar_service() -> PrecedentSimilarService:
+    """PrecedentSimilarService 싱글톤 (thread-safe, 리랭킹 여부는 환경변수 기준)"""
+    global _precedent_similar_service
+    if _precedent_similar_service is None:
+        with _precedent_similar_service_lock:
+            if _precedent_similar_service is None:
+                _precedent_similar_service = PrecedentSimilarService()
+    return _precedent_similar_service
@@ -92,16 +92,16 @@ class RAGService:
     def precedent_service(self):
         """Lazy loading for precedent service"""
         if self._precedent_service is None:
-            from app.services.precedent_search_service import PrecedentSearchService
-            self._precedent_service = PrecedentSearchService()
+            from app.services.precedent_search_service import get_precedent_search_service
+            self._precedent_service = get_precedent_search_service()
         return self._precedent_service
 
     @property
     def law_service(self):
         """Lazy loading for law service"""
         if self._law_service is None:
-            from app.services.search_laws_service import SearchLawsService
-            self._law_service = SearchLawsService()
+            from app.services.search_laws_service import get_search_laws_service
+            self._law_service = get_search_laws_service()
         return self._law_service
 
     async def retrieve(
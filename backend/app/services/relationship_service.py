@@ -4,6 +4,7 @@
 import json
 import logging
 import os
+import re
 from typing import List, Dict, Tuple
 from openai import AsyncOpenAI
 from fastapi import HTTPException
@@ -18,6 +19,9 @@ from app.prompts.relationship_prompt import create_relationship_prompt
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# LLM 응답의 ```json ... ``` 코드 블록 추출 (모듈 로드 시 1회 컴파일)
+_JSON_FENCE_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+
 
 class RelationshipService:
     """관계도 생성 및 관리 서비스"""
@@ -239,14 +243,9 @@ class RelationshipService:
             client_role=client_role or "원고"
         )
 
-        print(f"\n{'='*80}")
-        print(f"[LLM 프롬프트 - 관계도]")
-        print(f"{'='*80}")
-        print(f"프롬프트 길이: {len(prompt)} characters")
-        print(f"\n{prompt[:1000]}...")  # 처음 1000자만 출력
-        print(f"{'='*80}\n")
-
-        logger.info(f"[LLM] 프롬프트 생성 완료: {len(prompt)} characters")
+        # 프롬프트 전문은 DEBUG 레벨에서만 출력 (지연 포맷팅 - 비활성 시 문자열 생성 없음)
+        logger.debug("[LLM 프롬프트 - 관계도] (처음 1000자)\n%s...", prompt[:1000])
+        logger.info("[LLM] 프롬프트 생성 완료: %d characters", len(prompt))
 
         # OpenAI API 호출
         try:
@@ -267,12 +266,12 @@ class RelationshipService:
             )
 
             llm_response = response.choices[0].message.content
-            logger.info(f"[LLM] 응답 수신 완료: {len(llm_response)} characters")
-            logger.info(f"\n{'='*80}\n[LLM 응답]\n{'='*80}\n{llm_response}\n{'='*80}")
+            logger.info("[LLM] 응답 수신 완료: %d characters", len(llm_response))
+            logger.debug("[LLM 응답]\n%s", llm_response)
 
             # JSON 파싱
             relationship_data = self._parse_llm_response(llm_response)
-            logger.info(f"\n{'='*80}\n[파싱된 관계도 데이터]\n{'='*80}\n{relationship_data}\n{'='*80}")
+            logger.debug("[파싱된 관계도 데이터]\n%s", relationship_data)
 
             if not relationship_data:
                 raise ValueError("LLM이 빈 관계도를 반환했습니다")
@@ -501,8 +500,7 @@ class RelationshipService:
             logger.info(f"[Summary Generation] LLM 응답 수신: {len(llm_response)} characters")
 
             # JSON 파싱
-            import re
-            json_match = re.search(r'```json\s*(.*?)\s*```', llm_response, re.DOTALL)
+            json_match = _JSON_FENCE_RE.search(llm_response)
             if json_match:
                 json_str = json_match.group(1)
             else:
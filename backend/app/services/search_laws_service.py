@@ -19,16 +19,18 @@ v3.1 업데이트:
 import re
 import json
 import logging
+import threading
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
 from qdrant_client.http import models
 
 from tool.qdrant_client import get_qdrant_client
 from app.services.precedent_embedding_service import (
+    create_openai_embedding,
     create_openai_embedding_cached,
-    get_sparse_model,
+    embed_sparse,
+    get_executor,
     get_openai_client,
 )
 
@@ -64,9 +66,11 @@ class SearchLawsService:
 
     COLLECTION = "laws_hybrid"
 
+    # 조문 조회 시 필요한 payload 필드만 요청 (전송량 절감)
+    ARTICLE_PAYLOAD_FIELDS = ["point_type", "law_name", "article_number", "article_title", "content"]
+
     def __init__(self):
         self.qdrant_client = get_qdrant_client()
-        self.sparse_model = get_sparse_model()
         self.openai_client = get_openai_client()
 
     # ==================== 법적 쟁점 추출 (2단계 파이프라인 1단계) ====================
@@ -259,27 +263,26 @@ JSON 형식으로만 출력하라:
         return self.search_laws(query=search_query, limit=limit)
 
     def _create_dense_embedding(self, text: str) -> List[float]:
-        """Dense 임베딩 생성 (기존 캐싱 함수 재활용)"""
+        """Dense 임베딩 생성 - 검색 쿼리용 (기존 캐싱 함수 재활용)"""
         return list(create_openai_embedding_cached(text))
 
     def _create_sparse_embedding(self, text: str) -> models.SparseVector:
         """Sparse 임베딩 생성 (BM25)"""
-        sparse_emb = list(self.sparse_model.embed([text]))[0]
+        sparse_emb = embed_sparse([text])[0]
         return models.SparseVector(
             indices=sparse_emb.indices.tolist(),
             values=sparse_emb.values.tolist(),
         )
 
     def _create_embeddings_parallel(self, text: str):
-        """Dense와 Sparse 임베딩을 병렬로 생성"""
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            dense_future = executor.submit(self._create_dense_embedding, text)
-            sparse_future = executor.submit(self._create_sparse_embedding, text)
-
-            dense_vector = dense_future.result()
-            sparse_vector = sparse_future.result()
-
-        return dense_vector, sparse_vector
+        """
+        Dense와 Sparse 임베딩을 병렬로 생성
+        - Sparse(로컬 BM25, 수 ms)만 공용 executor에 제출, Dense(OpenAI API 대기)는 현재 요청 스레드에서 실행
+          (워커 2개인 공용 executor에서 API 대기가 동시 요청 간 줄서지 않도록)
+        """
+        sparse_future = get_executor().submit(self._create_sparse_embedding, text)
+        dense_vector = self._create_dense_embedding(text)
+        return dense_vector, sparse_future.result()
 
     def search_laws(
         self,
@@ -513,7 +516,7 @@ JSON 형식으로만 출력하라:
                 ]
             ),
             limit=20,
-            with_payload=True,
+            with_payload=self.ARTICLE_PAYLOAD_FIELDS,
         )
 
         # 2차 시도: 법령명 부분 매칭 (긴 법령명의 경우)
@@ -537,7 +540,7 @@ JSON 형식으로만 출력하라:
                     ]
                 ),
                 limit=20,
-                with_payload=True,
+                with_payload=self.ARTICLE_PAYLOAD_FIELDS,
             )
 
         if not results[0]:
@@ -648,11 +651,11 @@ JSON 형식으로만 출력하라:
             if not law_name or not article_number or not content:
                 return
 
-            # Dense 임베딩 생성
-            dense_vector = self._create_dense_embedding(content[:2000])  # 최대 2000자
+            # Dense 임베딩 생성 (저장용 → 양자화 캐시 없이 원본 정밀도)
+            dense_vector = create_openai_embedding(content[:2000])  # 최대 2000자
 
             # Sparse 임베딩 생성
-            sparse_emb = list(self.sparse_model.embed([content[:2000]]))[0]
+            sparse_emb = embed_sparse([content[:2000]])[0]
             sparse_vector = {
                 "indices": sparse_emb.indices.tolist(),
                 "values": sparse_emb.values.tolist(),
@@ -740,3 +743,19 @@ JSON 형식으로만 출력하라:
                 i += 1
 
         return paragraphs
+
+
+# ==================== 서비스 싱글톤 ====================
+
+_search_laws_service = None
+_search_laws_service_lock = threading.Lock()
+
+
+def get_search_laws_service() -> SearchLawsService:
+    """SearchLawsService 싱글톤 (thread-safe)"""
+    global _search_laws_service
+    if _search_laws_service is None:
+        with _search_laws_service_lock:
+            if _search_laws_service is None:
+                _search_laws_service = SearchLawsService()
+    return _search_laws_service
@@ -25,20 +25,17 @@ class STTService:
             # 파일 포인터를 처음으로 이동
             await file.seek(0)
 
-            # 파일 내용을 읽기
-            file_content = await file.read()
-
             # 안전한 파일명 생성 (확장자만 추출)
             # 예: "단톡방 1.mp3" → "audio.mp3"
-            import os
             file_extension = os.path.splitext(file.filename)[1]  # ".mp3"
             safe_filename = f"audio{file_extension}"  # "audio.mp3"
 
             # OpenAI Whisper API는 파일명(확장자)이 필요하므로 튜플 형식으로 전달
-            # (filename, file_content, content_type)
+            # (filename, file object, content_type)
+            # 전체를 bytes로 읽지 않고 업로드 임시 파일(file.file)을 그대로 넘겨 메모리 이중 적재 방지
             transcript = await self.client.audio.transcriptions.create(
                 model="whisper-1",
-                file=(safe_filename, file_content, file.content_type),
+                file=(safe_filename, file.file, file.content_type),
                 language="ko"  # 한국어 우선 인식
             )
 
@@ -1,20 +1,160 @@
-import json
 import re
+import asyncio
+import hashlib
 import logging
 import os
-from typing import List, Optional
+import threading
+from typing import Dict, List, Optional
+import orjson
 from openai import AsyncOpenAI
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Bundle, Session
 
 # DB 모델들 (반드시 evidence.py에서 import!)
 from app.models.evidence import Case, Evidence, CaseAnalysis, CaseEvidenceMapping
 from app.models.timeline import TimeLine
-from app.prompts.timeline_prompt import create_timeline_prompt
+from app.prompts.timeline_prompt import TIMELINE_SYSTEM_PROMPT, create_timeline_prompt
+from app.config import TimelineConfig
+from tool.ttl_cache import TTLCache
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# DEBUG 로그 구분선
+_DIVIDER = "=" * 80
+
+# 관련도 계산용 어휘 토큰 (한글/영문/숫자 2글자 이상)
+_TERM_RE = re.compile(r'[가-힣A-Za-z0-9]{2,}')
+
+# 날짜 표기 (2024-01-15, 2024.1.15, 2024년 1월 15일) - 타임라인 이벤트 후보 구간 가중치용
+_DATE_RE = re.compile(r'\d{4}\s*[-./년]\s*\d{1,2}\s*[-./월]\s*\d{1,2}')
+_DATE_WEIGHT = 3  # 날짜 1건 = 질의 어휘 3회 등장과 같은 점수
+
+
+def _snippet_score(text: str, query_terms: set) -> int:
+    """구간 관련도 = 질의 어휘 등장 수 + 날짜 표기 수 × _DATE_WEIGHT"""
+    term_hits = sum(1 for term in _TERM_RE.findall(text) if term in query_terms)
+    return term_hits + _DATE_WEIGHT * len(_DATE_RE.findall(text))
+
+
+def _select_relevant_snippets(content: str, query_terms: set, budget: int, window: int) -> str:
+    """
+    긴 증거 본문에서 타임라인과 관련 높은 구간만 골라 budget 글자 이내로 반환
+
+    본문을 window 글자 단위 구간으로 나눠 질의 어휘 등장 수와 날짜 표기 수로 점수를 매기고,
+    점수 높은 구간부터 채운 뒤 원문 순서대로 이어 붙임 (생략된 부분은 "..."로 표시)
+    """
+    if len(content) <= budget:
+        return content
+
+    windows = [content[i:i + window] for i in range(0, len(content), window)]
+    scores = [_snippet_score(text, query_terms) for text in windows]
+    scored = sorted(range(len(windows)), key=lambda idx: (-scores[idx], idx))
+
+    selected = []
+    used = 0
+    for idx in scored:
+        if used + len(windows[idx]) > budget:
+            continue
+        selected.append(idx)
+        used += len(windows[idx])
+
+    selected.sort()
+    snippets = []
+    prev = -1
+    for idx in selected:
+        if idx != prev + 1:
+            snippets.append("...")
+        snippets.append(windows[idx])
+        prev = idx
+    if prev != len(windows) - 1:
+        snippets.append("...")
+    return "\n".join(snippets)
+
+
+class _TimelineEventStream:
+    """
+    스트리밍 LLM 응답에서 타임라인 이벤트 객체를 점진적으로 추출
+
+    응답 `{"events": [...]}` 의 이벤트 배열 안에서 객체 `{...}` 가 닫힐 때마다 즉시 파싱하여 events에 추가합니다.
+    (첫 `[` 이전 텍스트는 건너뜀, 문자열 내부의 괄호/이스케이프는 무시)
+    """
+
+    def __init__(self):
+        self.events: List[dict] = []
+        self._buffer: List[str] = []
+        self._in_array = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, text: str) -> None:
+        for ch in text:
+            if not self._in_array:
+                self._in_array = ch == "["
+                continue
+
+            if self._depth == 0:
+                if ch == "{":
+                    self._depth = 1
+                    self._buffer = [ch]
+                continue
+
+            self._buffer.append(ch)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit("".join(self._buffer))
+
+    def _emit(self, raw: str) -> None:
+        try:
+            event = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            logger.warning("[Stream Parse] 이벤트 파싱 실패 (처음 200자): %s", raw[:200])
+            return
+        if isinstance(event, dict):
+            self.events.append(event)
+
+
+# 진행 중인 타임라인 생성 (case_id → 완료 Future, 프로세스 내)
+# 같은 사건에 대한 동시 요청은 LLM을 한 번만 호출하고 나머지는 그 결과를 재사용
+_inflight_generations: Dict[int, asyncio.Future] = {}
+
+# 입력 내용 해시 → LLM이 생성한 타임라인 이벤트 (프로세스 내)
+# 사건 요약/증거가 바뀌지 않은 재생성 요청은 LLM 호출 없이 이전 결과를 그대로 저장
+_timeline_cache = TTLCache(maxsize=256, ttl=86400)
+
+_openai_client: Optional[AsyncOpenAI] = None
+_openai_lock = threading.Lock()
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """
+    AsyncOpenAI 클라이언트 싱글톤 (thread-safe)
+    서비스 인스턴스마다 새로 만들면 요청마다 커넥션 풀/TLS 핸드셰이크가 새로 생기므로 프로세스 전체에서 공유
+    """
+    global _openai_client
+    if _openai_client is None:
+        with _openai_lock:
+            if _openai_client is None:
+                api_key = os.getenv("OPENAI_API_KEY")
+                if not api_key:
+                    raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다")
+                _openai_client = AsyncOpenAI(api_key=api_key)
+    return _openai_client
+
 
 class TimeLineService:
     """
@@ -32,13 +172,10 @@ class TimeLineService:
         self.db = db
         self.case_id = case_id
 
-        # OpenAI 클라이언트 초기화
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다")
-        self.openai_client = AsyncOpenAI(api_key=api_key)
+        # 공유 OpenAI 클라이언트 (커넥션 재사용)
+        self.openai_client = get_async_openai_client()
 
-    async def generate_timeline_auto(self) -> List[TimeLine]:
+    async def generate_timeline_auto(self, use_cache: bool = True, replace_existing: bool = False) -> List[TimeLine]:
         """
         타임라인 자동 생성 (사용자 요구사항 구현)
 
@@ -49,37 +186,83 @@ class TimeLineService:
         4. DB에 저장
         5. 저장된 TimeLine 객체 반환
 
+        Args:
+            use_cache: False면 입력 해시 캐시를 건너뛰고 LLM으로 새로 생성 (강제 재생성용)
+                       새 결과는 캐시에 덮어써 이후 자동 생성에서 재사용
+            replace_existing: True면 기존 타임라인이 있어도 새로 생성하고, 생성 성공 후
+                              기존 타임라인 삭제 + 새 타임라인 저장을 한 트랜잭션으로 커밋
+                              (생성/저장 실패 시 기존 타임라인 유지)
+
         Returns:
             List[TimeLine]: 생성된 타임라인 리스트
 
         Raises:
             HTTPException: 사건을 찾을 수 없거나 OpenAI API 실패 시
         """
-        logger.info(f"[Timeline Generation] 시작: case_id={self.case_id}")
-
-        # 0. 중복 생성 방지: 타임라인이 이미 존재하는지 다시 확인
-        existing_timelines = self.db.query(TimeLine).filter(
-            TimeLine.case_id == self.case_id
-        ).all()
+        # 같은 사건의 생성이 이미 진행 중이면 LLM을 다시 호출하지 않고 완료를 기다림
+        # 완료 후 재진입 → 저장된 타임라인 반환 (선행 요청 실패 시 이 요청이 생성 담당)
+        inflight = _inflight_generations.get(self.case_id)
+        if inflight is not None:
+            logger.info("[Timeline Generation] 동일 사건 생성 진행 중 - 완료 대기: case_id=%s", self.case_id)
+            await asyncio.shield(inflight)
+            return await self.generate_timeline_auto(use_cache=use_cache, replace_existing=replace_existing)
+
+        future = asyncio.get_running_loop().create_future()
+        _inflight_generations[self.case_id] = future
+        try:
+            return await self._generate_timeline(use_cache, replace_existing)
+        finally:
+            _inflight_generations.pop(self.case_id, None)
+            future.set_result(None)
+
+    async def _generate_timeline(self, use_cache: bool, replace_existing: bool) -> List[TimeLine]:
+        """generate_timeline_auto 본체 (사건별 동시 요청 합류 처리 이후 실행)"""
+        logger.info("[Timeline Generation] 시작: case_id=%s", self.case_id)
+
+        # 동기 SQLAlchemy 호출은 asyncio.to_thread로 실행 → DB 대기 중 이벤트 루프 블로킹 방지
+        # (세션은 한 번에 하나의 스레드에서만 순차 사용)
+
+        # 0. 중복 생성 방지: 타임라인이 이미 존재하는지 다시 확인 (재생성은 저장 시 교체)
+        if not replace_existing:
+            existing_timelines = await asyncio.to_thread(
+                lambda: self.db.query(TimeLine).filter(TimeLine.case_id == self.case_id).all()
+            )
 
-        if existing_timelines:
-            print(f"[Timeline Generation] ⚠️  이미 존재함 (중복 생성 방지): {len(existing_timelines)}개")
-            logger.info(f"[Timeline Generation] 이미 존재함 (중복 생성 방지): {len(existing_timelines)}개")
-            return existing_timelines
+            if existing_timelines:
+                logger.info("[Timeline Generation] 이미 존재함 (중복 생성 방지): %d개", len(existing_timelines))
+                return existing_timelines
 
         # 1. DB에서 데이터 조회
-        case, evidences, case_summary, evidence_mappings = self._fetch_case_and_evidences()
-        logger.info(f"[Timeline Generation] 데이터 조회 완료: evidences={len(evidences)}개, mappings={len(evidence_mappings)}개")
+        case, evidences, case_summary, evidence_mappings = await asyncio.to_thread(self._fetch_case_and_evidences)
+        logger.info("[Timeline Generation] 데이터 조회 완료: evidences=%d개, mappings=%d개", len(evidences), len(evidence_mappings))
+
+        # 분석할 내용(증거 본문, 사건 요약, 사건 설명)이 전혀 없으면 LLM 호출 없이 빈 타임라인 반환
+        # (요약 없이 호출해도 의미 없는 이벤트만 생성됨 - 저장하지 않으므로 내용 추가 후 다시 생성 가능)
+        if not evidences and not case_summary and not (case.description or "").strip():
+            logger.info("[Timeline Generation] 분석할 사건 정보/증거 없음 - LLM 호출 생략: case_id=%s", self.case_id)
+            if replace_existing:
+                await asyncio.to_thread(self._save_timelines_to_db, [], replace_existing=True)
+            return []
+
+        # 입력이 이전 생성과 동일하면 LLM 호출(요약 폴백 포함) 생략 (강제 재생성은 캐시 무시)
+        cache_key = self._make_input_key(case, evidences, case_summary, evidence_mappings)
+        cached_data = _timeline_cache.get(cache_key) if use_cache else None
+        if cached_data is not None:
+            logger.info("[Timeline Generation] 입력 해시 캐시 히트 - LLM 호출 생략: %d개 이벤트", len(cached_data))
+            return await asyncio.to_thread(
+                self._save_timelines_to_db, cached_data, firm_id=case.law_firm_id, evidences=evidences,
+                replace_existing=replace_existing
+            )
 
         # 2. Case Summary에서 데이터 추출 (또는 증거 기반 자동 생성)
         if case_summary:
             summary = case_summary.summary or case.title or "사건 요약 없음"
             facts = case_summary.facts or case.description or "사실관계 없음"
             claims = case_summary.claims or "청구내용 없음"
-            logger.info(f"[Timeline Generation] Case Summary 캐시 히트")
+            logger.info("[Timeline Generation] Case Summary 캐시 히트")
         else:
             # Fallback: 증거 데이터로부터 LLM이 자동 생성
-            logger.warning(f"[Timeline Generation] Case Summary 캐시 미스 - 증거 데이터로부터 자동 생성")
+            logger.warning("[Timeline Generation] Case Summary 캐시 미스 - 증거 데이터로부터 자동 생성")
             summary, facts, claims = await self._generate_summary_from_evidences(
                 case, evidences, evidence_mappings
             )
@@ -92,17 +275,21 @@ class TimeLineService:
         )
 
         if not timeline_data:
-            logger.error(f"[Timeline Generation] LLM 응답 파싱 실패 - 타임라인 생성 불가")
+            logger.error("[Timeline Generation] LLM 응답 파싱 실패 - 타임라인 생성 불가")
             raise HTTPException(
                 status_code=500,
                 detail="타임라인 생성에 실패했습니다. LLM 응답을 파싱할 수 없습니다."
             )
 
-        logger.info(f"[Timeline Generation] 타임라인 생성 완료: {len(timeline_data)}개 이벤트")
+        logger.info("[Timeline Generation] 타임라인 생성 완료: %d개 이벤트", len(timeline_data))
+        _timeline_cache.put(cache_key, timeline_data)
 
         # 4. DB에 저장 (증거 연결 포함)
-        saved_timelines = self._save_timelines_to_db(timeline_data, firm_id=case.law_firm_id, evidences=evidences)
-        logger.info(f"[Timeline Generation] DB 저장 완료: {len(saved_timelines)}개")
+        saved_timelines = await asyncio.to_thread(
+            self._save_timelines_to_db, timeline_data, firm_id=case.law_firm_id, evidences=evidences,
+            replace_existing=replace_existing
+        )
+        logger.info("[Timeline Generation] DB 저장 완료: %d개", len(saved_timelines))
 
         return saved_timelines
 
@@ -111,52 +298,95 @@ class TimeLineService:
         DB에서 case 데이터와 evidence 목록 조회
 
         Returns:
-            tuple: (case: Case, evidences: List[Evidence], case_summary: CaseAnalysis | None, evidence_mappings: dict)
+            tuple: (case: Case, evidences: List[Evidence 컬럼 행], case_summary: CaseAnalysis | None, evidence_mappings: dict)
+            evidences의 content는 TimelineConfig.MAX_EVIDENCE_CHARS 글자까지만 포함
 
         Raises:
             HTTPException: 사건을 찾을 수 없을 때
         """
-        # Case 조회
-        case = self.db.query(Case).filter(Case.id == self.case_id).first()
-        if not case:
-            raise HTTPException(
-                status_code=404,
-                detail=f"사건 ID {self.case_id}를 찾을 수 없습니다"
-            )
+        # 증거는 프롬프트에 필요한 컬럼만 조회, content는 DB에서 잘라서 전송 (MB 단위 원문 전송 방지)
+        # Bundle 행은 Evidence와 같은 속성명(id, file_name, doc_type, created_at, content)으로 접근
+        evidence_columns = Bundle(
+            "evidence",
+            Evidence.id,
+            Evidence.file_name,
+            Evidence.doc_type,
+            Evidence.created_at,
+            func.substr(Evidence.content, 1, TimelineConfig.MAX_EVIDENCE_CHARS).label("content"),
+        )
 
-        # Evidence 조회 (CaseEvidenceMapping을 통해 JOIN)
-        # content가 있는 것만 조회
-        evidences = self.db.query(Evidence).join(
-            CaseEvidenceMapping,
-            Evidence.id == CaseEvidenceMapping.evidence_id
+        # Case + CaseAnalysis + CaseEvidenceMapping + Evidence 를 1회 쿼리로 조회 (OUTER JOIN)
+        # - 매핑 행 수만큼 row가 반복되며 Case/CaseAnalysis는 identity map으로 같은 객체
+        # - (case_id, evidence_id) UNIQUE 제약 인덱스로 매핑 조회
+        rows = self.db.query(Case, CaseAnalysis, CaseEvidenceMapping, evidence_columns).outerjoin(
+            CaseAnalysis, CaseAnalysis.case_id == Case.id
+        ).outerjoin(
+            CaseEvidenceMapping, CaseEvidenceMapping.case_id == Case.id
+        ).outerjoin(
+            Evidence, Evidence.id == CaseEvidenceMapping.evidence_id
         ).filter(
-            CaseEvidenceMapping.case_id == self.case_id,
-            Evidence.content.isnot(None),
-            Evidence.content != ""
+            Case.id == self.case_id
         ).all()
 
-        # Case Summary 캐시 조회
-        case_summary = self.db.query(CaseAnalysis).filter(
-            CaseAnalysis.case_id == self.case_id
-        ).first()
+        if not rows:
+            raise HTTPException(
+                status_code=404,
+                detail=f"사건 ID {self.case_id}를 찾을 수 없습니다"
+            )
 
-        # CaseEvidenceMapping 조회 (증거 날짜와 설명 정보)
-        mappings = self.db.query(CaseEvidenceMapping).filter(
-            CaseEvidenceMapping.case_id == self.case_id
-        ).all()
+        case, case_summary = rows[0][0], rows[0][1]
 
-        # evidence_id를 키로 하는 매핑 딕셔너리 생성
-        evidence_mappings = {
-            mapping.evidence_id: {
+        # 매핑을 한 번 순회하며 evidence_id 매핑 딕셔너리(증거 날짜, 설명)와 증거 목록을 함께 구성
+        # content가 있는 증거만 포함
+        evidence_mappings = {}
+        evidences = []
+        for _, _, mapping, evidence in rows:
+            if mapping is None:
+                continue
+            evidence_mappings[mapping.evidence_id] = {
                 "evidence_date": mapping.evidence_date,
                 "description": mapping.description
             }
-            for mapping in mappings
-        }
+            # OUTER JOIN 미매칭 시 Bundle 행의 모든 값이 None
+            if evidence is not None and evidence.id is not None and evidence.content:
+                evidences.append(evidence)
 
         return case, evidences, case_summary, evidence_mappings
 
-    def _save_timelines_to_db(self, timeline_data: List[dict], firm_id: int = None, evidences: List[Evidence] = None) -> List[TimeLine]:
+    @staticmethod
+    def _make_input_key(case: Case, evidences: list, case_summary: Optional[CaseAnalysis], evidence_mappings: dict) -> str:
+        """
+        타임라인 생성 입력(사건 요약, 의뢰인 정보, 증거 내용, 매핑)의 내용 해시
+
+        증거 content는 원문 대신 해시만 키에 포함 (BLAKE2b - SHA-256보다 빠름)
+        법무법인 ID를 포함하여 다른 법인 간 결과가 공유되지 않도록 함
+        """
+        def digest(text: Optional[str]) -> str:
+            return hashlib.blake2b((text or "").encode(), digest_size=16).hexdigest()
+
+        payload = {
+            "firm_id": case.law_firm_id,
+            "title": case.title,
+            "description": digest(case.description),
+            "client": [case.client_name, case.client_role],
+            "summary": [case_summary.summary, case_summary.facts, case_summary.claims] if case_summary else None,
+            "evidences": [
+                [e.id, e.file_name, e.doc_type, str(e.created_at), digest(e.content)] for e in evidences
+            ],
+            "mappings": sorted(
+                [k, str(v.get("evidence_date")), v.get("description")] for k, v in evidence_mappings.items()
+            ),
+        }
+        raw = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def _save_timelines_to_db(
+        self,
+        timeline_data: List[dict],
+        firm_id: int = None,
+        evidences: List[Evidence] = None,
+        replace_existing: bool = False,
+    ) -> List[TimeLine]:
         """
         타임라인 데이터를 DB에 저장
 
@@ -164,51 +394,78 @@ class TimeLineService:
             timeline_data: LLM이 반환한 타임라인 딕셔너리 리스트
             firm_id: 법무법인 ID (선택)
             evidences: 증거 목록 (증거 링크용)
+            replace_existing: True면 기존 타임라인 삭제를 같은 트랜잭션에서 수행 (실패 시 함께 롤백)
 
         Returns:
             List[TimeLine]: 저장된 TimeLine 객체 리스트
         """
-        saved_timelines = []
+        rows = []
+
+        # 파일명 → 증거 ID 인덱스 1회 구성 (동일 파일명은 먼저 나온 증거 우선)
+        file_name_to_id = {}
+        for evidence in evidences or []:
+            if evidence.file_name and evidence.file_name not in file_name_to_id:
+                file_name_to_id[evidence.file_name] = evidence.id
 
         for idx, item in enumerate(timeline_data):
             # 증거 연결 시도
             evidence_id = None
-            if item.get("type") == "증거" and evidences:
-                # actor 필드에서 증거 파일명 추출 시도
+            if item.get("type") == "증거" and file_name_to_id:
                 actor = item.get("actor", "")
-                for evidence in evidences:
-                    # 파일명이 actor에 포함되어 있는지 확인
-                    if evidence.file_name and evidence.file_name in actor:
-                        evidence_id = evidence.id
-                        logger.info(f"[Timeline Save] 증거 연결: {evidence.file_name} (ID: {evidence_id})")
-                        break
-                    # 또는 타이틀에 파일명이 포함되어 있는지 확인
-                    elif evidence.file_name and evidence.file_name in item.get("title", ""):
-                        evidence_id = evidence.id
-                        logger.info(f"[Timeline Save] 증거 연결 (제목 기반): {evidence.file_name} (ID: {evidence_id})")
-                        break
-
-            timeline = TimeLine(
-                case_id=self.case_id,
-                firm_id=firm_id,
-                evidence_id=evidence_id,
-                date=item.get("date", "미상"),
-                time=item.get("time", "00:00"),
-                title=item.get("title", "제목 없음"),
-                description=item.get("description", ""),
-                type=item.get("type", "기타"),
-                actor=item.get("actor", ""),
-                order_index=idx
-            )
-            self.db.add(timeline)
-            saved_timelines.append(timeline)
+                # actor가 파일명과 정확히 일치하면 바로 연결 (프롬프트 지침상 일반적인 경우)
+                evidence_id = file_name_to_id.get(actor)
+                if evidence_id is not None:
+                    logger.info("[Timeline Save] 증거 연결: %s (ID: %s)", actor, evidence_id)
+                else:
+                    title = item.get("title", "")
+                    for file_name, candidate_id in file_name_to_id.items():
+                        # 파일명이 actor에 포함되어 있는지 확인
+                        if file_name in actor:
+                            evidence_id = candidate_id
+                            logger.info("[Timeline Save] 증거 연결: %s (ID: %s)", file_name, evidence_id)
+                            break
+                        # 또는 타이틀에 파일명이 포함되어 있는지 확인
+                        elif file_name in title:
+                            evidence_id = candidate_id
+                            logger.info("[Timeline Save] 증거 연결 (제목 기반): %s (ID: %s)", file_name, evidence_id)
+                            break
+
+            rows.append({
+                "case_id": self.case_id,
+                "firm_id": firm_id,
+                "evidence_id": evidence_id,
+                "date": item.get("date", "미상"),
+                "time": item.get("time", "00:00"),
+                "title": item.get("title", "제목 없음"),
+                "description": item.get("description", ""),
+                "type": item.get("type", "기타"),
+                "actor": item.get("actor", ""),
+                "order_index": idx,
+            })
+
+        if not rows and not replace_existing:
+            return []
 
-        # Commit
-        self.db.commit()
+        # 1회 INSERT ... RETURNING 으로 일괄 저장 (DB 기본값 id/created_at 포함 객체 반환)
+        # → 행마다 refresh SELECT 하던 N회 왕복 제거
+        # 다건 INSERT(insertmanyvalues)는 RETURNING 순서를 보장하지 않으므로 sort_by_parameter_order로 입력 순서 유지
+        stmt = insert(TimeLine).returning(TimeLine, sort_by_parameter_order=True)
 
-        # Refresh to get IDs
-        for timeline in saved_timelines:
-            self.db.refresh(timeline)
+        # RETURNING으로 모든 컬럼이 채워져 있으므로 커밋 시 만료시키지 않음 (만료 시 접근마다 SELECT 재발생)
+        expire_on_commit = self.db.expire_on_commit
+        self.db.expire_on_commit = False
+        try:
+            if replace_existing:
+                deleted_count = self.db.query(TimeLine).filter(TimeLine.case_id == self.case_id).delete()
+                logger.info("[Timeline Save] 기존 타임라인 교체: %d개 삭제", deleted_count)
+            saved_timelines = list(self.db.scalars(stmt, rows).all()) if rows else []
+            self.db.commit()
+        except Exception:
+            # 실패한 트랜잭션 상태로 세션이 재사용되지 않도록 롤백
+            self.db.rollback()
+            raise
+        finally:
+            self.db.expire_on_commit = expire_on_commit
 
         return saved_timelines
 
@@ -241,16 +498,15 @@ class TimeLineService:
             HTTPException: OpenAI API 실패 시
         """
         # 증거 목록을 텍스트로 변환
-        evidence_text = self._format_evidences(evidences, evidence_mappings)
+        # 긴 증거는 사건 요약/사실관계와 관련된 구간만 포함
+        evidence_text = self._format_evidences(
+            evidences, evidence_mappings, relevance_query=f"{summary}\n{facts}"
+        )
 
-        # 증거 텍스트 로그 (확인용)
-        print(f"\n{'='*80}")
-        print(f"[증거 텍스트 확인]")
-        print(f"{'='*80}")
-        print(f"증거 개수: {len(evidences)}")
-        print(f"증거 텍스트 길이: {len(evidence_text)} characters")
-        print(f"증거 텍스트 미리보기 (처음 500자):\n{evidence_text[:500]}")
-        print(f"{'='*80}\n")
+        # 증거 텍스트 로그 (전체 미리보기는 DEBUG 레벨에서만 문자열 생성)
+        logger.info("[LLM] 증거 %d개, 증거 텍스트 %d characters", len(evidences), len(evidence_text))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[LLM] 증거 텍스트 미리보기 (처음 500자):\n%s", evidence_text[:500])
 
         # LLM 프롬프트 생성 (의뢰인 정보 포함)
         prompt = create_timeline_prompt(
@@ -262,23 +518,20 @@ class TimeLineService:
             client_role=client_role or "원고"
         )
 
-        print(f"\n{'='*80}")
-        print(f"[LLM 프롬프트 전체]")
-        print(f"{'='*80}")
-        print(f"프롬프트 길이: {len(prompt)} characters")
-        print(f"\n{prompt}")
-        print(f"{'='*80}\n")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\n%s\n[LLM 프롬프트 전체]\n%s\n%s\n%s", _DIVIDER, _DIVIDER, prompt, _DIVIDER)
 
-        logger.info(f"[LLM] 프롬프트 생성 완료: {len(prompt)} characters")
+        logger.info("[LLM] 프롬프트 생성 완료: %d characters", len(prompt))
 
-        # OpenAI API 호출
+        # OpenAI API 호출 (스트리밍: 생성 중 닫힌 이벤트 객체부터 순차 파싱)
         try:
-            response = await self.openai_client.chat.completions.create(
+            stream = await self.openai_client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {
+                        # 고정 지침 (요청 간 동일 프리픽스 → OpenAI 자동 프롬프트 캐싱)
                         "role": "system",
-                        "content": "당신은 법률 사건 타임라인 분석 전문가입니다. 주어진 사건 정보와 증거를 바탕으로 시간순 타임라인을 생성하고, 각 이벤트와 관련된 주요 쟁점사항도 함께 분석해주세요."
+                        "content": TIMELINE_SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -286,16 +539,32 @@ class TimeLineService:
                     }
                 ],
                 temperature=0.3,
-                max_tokens=4000
+                max_tokens=4000,
+                response_format={"type": "json_object"},  # 본문 전체가 JSON 객체로 보장됨 (코드 블록 없음)
+                stream=True,
             )
 
-            llm_response = response.choices[0].message.content
-            logger.info(f"[LLM] 응답 수신 완료: {len(llm_response)} characters")
-            logger.info(f"\n{'='*80}\n[LLM 응답]\n{'='*80}\n{llm_response}\n{'='*80}")
-
-            # JSON 파싱
-            timeline_data = self._parse_llm_response(llm_response)
-            logger.info(f"\n{'='*80}\n[파싱된 타임라인 데이터]\n{'='*80}\n{timeline_data}\n{'='*80}")
+            event_stream = _TimelineEventStream()
+            response_parts = []
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    response_parts.append(delta)
+                    event_stream.feed(delta)
+
+            llm_response = "".join(response_parts)
+            logger.info("[LLM] 응답 수신 완료: %d characters, 스트리밍 파싱 %d개 이벤트", len(llm_response), len(event_stream.events))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("\n%s\n[LLM 응답]\n%s\n%s\n%s", _DIVIDER, _DIVIDER, llm_response, _DIVIDER)
+
+            # 스트리밍 중 파싱된 이벤트 검증, 없으면 전체 응답 파싱으로 폴백
+            timeline_data = self._validate_timeline_items(event_stream.events)
+            if not timeline_data:
+                timeline_data = self._parse_llm_response(llm_response)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("\n%s\n[파싱된 타임라인 데이터]\n%s\n%s\n%s", _DIVIDER, _DIVIDER, timeline_data, _DIVIDER)
 
             if not timeline_data:
                 raise ValueError("LLM이 빈 타임라인을 반환했습니다")
@@ -303,19 +572,26 @@ class TimeLineService:
             return timeline_data
 
         except Exception as e:
-            logger.error(f"[LLM] OpenAI API 호출 실패: {str(e)}")
+            logger.error("[LLM] OpenAI API 호출 실패: %s", e)
             raise HTTPException(
                 status_code=503,
                 detail=f"타임라인 생성 서비스에 일시적인 문제가 발생했습니다. 잠시 후 다시 시도해주세요."
             )
 
-    def _format_evidences(self, evidences: Optional[List[Evidence]], evidence_mappings: dict = None) -> str:
+    def _format_evidences(
+        self,
+        evidences: Optional[List[Evidence]],
+        evidence_mappings: dict = None,
+        relevance_query: Optional[str] = None
+    ) -> str:
         """
         증거 목록을 텍스트로 포맷팅
 
         Args:
             evidences: 증거 목록
             evidence_mappings: 증거 ID별 매핑 정보 (날짜, 설명)
+            relevance_query: 지정 시 TimelineConfig.EVIDENCE_PROMPT_CHARS를 넘는 증거는
+                             이 텍스트와 관련 높은 구간만 포함
 
         Returns:
             str: 포맷팅된 증거 목록 텍스트
@@ -329,81 +605,96 @@ class TimeLineService:
         if not evidences_with_content:
             return "증거 텍스트가 아직 추출되지 않았습니다."
 
-        evidence_lines = []
+        query_terms = set(_TERM_RE.findall(relevance_query)) if relevance_query else None
+
+        # 증거별 필드를 리스트에 모아 한 번에 join (+= 연결 시 매번 생기는 문자열 복사 방지)
+        evidence_blocks = []
         for i, evidence in enumerate(evidences_with_content, 1):
-            line = f"**증거 {i}: {evidence.file_name}**"
+            parts = [f"**증거 {i}: {evidence.file_name}**"]
 
             # 문서 유형 명시
             if evidence.doc_type:
-                line += f"\n문서 유형: {evidence.doc_type}"
+                parts.append(f"문서 유형: {evidence.doc_type}")
 
             # CaseEvidenceMapping 정보 추가
-            if evidence_mappings and evidence.id in evidence_mappings:
-                mapping = evidence_mappings[evidence.id]
-
+            mapping = evidence_mappings.get(evidence.id) if evidence_mappings else None
+            if mapping:
                 # 증거 발생일
                 if mapping.get("evidence_date"):
-                    line += f"\n증거 발생일: {mapping['evidence_date']}"
+                    parts.append(f"증거 발생일: {mapping['evidence_date']}")
 
                 # 증거 설명 (사건 맥락)
                 if mapping.get("description"):
-                    line += f"\n증거 설명: {mapping['description']}"
+                    parts.append(f"증거 설명: {mapping['description']}")
 
             # 등록일
             if evidence.created_at:
-                line += f"\n등록일: {evidence.created_at.strftime('%Y-%m-%d %H:%M')}"
+                parts.append(f"등록일: {evidence.created_at.strftime('%Y-%m-%d %H:%M')}")
 
-            # 전체 content 포함 (LLM이 필요한 만큼 사용)
-            if evidence.content:
-                line += f"\n\n내용:\n{evidence.content}"
+            # content 포함 - 빈 줄 뒤에 배치
+            # relevance_query가 있으면 긴 증거는 관련 구간만 (입력 토큰 = LLM 지연/비용 절감)
+            content = evidence.content
+            if query_terms:
+                content = _select_relevant_snippets(
+                    content, query_terms,
+                    TimelineConfig.EVIDENCE_PROMPT_CHARS, TimelineConfig.SNIPPET_WINDOW_CHARS
+                )
+            parts.append("")
+            parts.append("내용:")
+            parts.append(content)
 
-            evidence_lines.append(line)
+            evidence_blocks.append("\n".join(parts))
 
-        return "\n\n---\n\n".join(evidence_lines)
+        return "\n\n---\n\n".join(evidence_blocks)
 
     def _parse_llm_response(self, llm_response: str) -> List[dict]:
         """
         LLM 응답을 파싱하여 타임라인 데이터 추출
 
         Args:
-            llm_response: LLM의 JSON 응답
+            llm_response: LLM의 JSON 응답 ({"events": [...]})
 
         Returns:
             List[dict]: 타임라인 데이터 리스트 (빈 리스트면 파싱 실패)
         """
         try:
-            # JSON 코드 블록에서 추출
-            json_match = re.search(r'```json\s*([\s\S]*?)\s*```', llm_response)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # 코드 블록이 없으면 전체 응답을 JSON으로 파싱 시도
-                json_str = llm_response.strip()
-
-            timeline_data = json.loads(json_str)
+            # JSON 모드 응답이므로 본문 전체를 바로 파싱 (코드 블록 추출 불필요)
+            response = orjson.loads(llm_response)
+            timeline_data = response.get("events") if isinstance(response, dict) else response
 
             # 배열인지 확인
             if not isinstance(timeline_data, list):
-                logger.warning(f"[Parse] LLM이 배열이 아닌 응답 반환: {type(timeline_data)}")
+                logger.warning("[Parse] LLM이 배열이 아닌 응답 반환: %s", type(timeline_data))
                 return []
 
-            # 필수 필드 검증
-            valid_data = []
-            for item in timeline_data:
-                # 필수 필드: date, time, title
-                if all(key in item for key in ["date", "time", "title"]):
-                    valid_data.append(item)
-                else:
-                    logger.warning(f"[Parse] 필수 필드 누락: {item}")
-
-            logger.info(f"[Parse] 파싱 성공: {len(valid_data)}개 이벤트")
-            return valid_data
+            return self._validate_timeline_items(timeline_data)
 
-        except json.JSONDecodeError as e:
-            logger.error(f"[Parse] JSON 파싱 실패: {e}")
-            logger.debug(f"[Parse] 응답 내용 (처음 500자): {llm_response[:500]}")
+        except orjson.JSONDecodeError as e:
+            logger.error("[Parse] JSON 파싱 실패: %s", e)
+            logger.debug("[Parse] 응답 내용 (처음 500자): %s", llm_response[:500])
             return []
 
+    def _validate_timeline_items(self, items: List[dict]) -> List[dict]:
+        """
+        필수 필드(date, time, title)가 있는 타임라인 이벤트만 반환
+
+        Args:
+            items: 파싱된 이벤트 딕셔너리 리스트
+
+        Returns:
+            List[dict]: 유효한 이벤트 리스트
+        """
+        valid_data = []
+        for item in items:
+            # 필수 필드: date, time, title
+            if isinstance(item, dict) and all(key in item for key in ["date", "time", "title"]):
+                valid_data.append(item)
+            else:
+                logger.warning("[Parse] 필수 필드 누락: %s", item)
+
+        logger.info("[Parse] 파싱 성공: %d개 이벤트", len(valid_data))
+        return valid_data
+
     async def _generate_summary_from_evidences(
         self,
         case: Case,
@@ -421,14 +712,14 @@ class TimeLineService:
         Returns:
             tuple: (summary, facts, claims)
         """
-        logger.info(f"[Summary Generation] 증거 기반 요약 생성 시작")
+        logger.info("[Summary Generation] 증거 기반 요약 생성 시작")
 
         # 증거 텍스트 포맷팅
         evidence_text = self._format_evidences(evidences, evidence_mappings)
 
         # 증거가 없으면 기본값 반환
         if not evidences or "증거 텍스트가 아직 추출되지 않았습니다" in evidence_text:
-            logger.warning(f"[Summary Generation] 증거 없음 - 기본값 반환")
+            logger.warning("[Summary Generation] 증거 없음 - 기본값 반환")
             return (
                 case.title or "사건 요약 없음",
                 case.description or "사실관계 없음",
@@ -480,29 +771,30 @@ class TimeLineService:
             )
 
             llm_response = response.choices[0].message.content
-            logger.info(f"[Summary Generation] LLM 응답 수신: {len(llm_response)} characters")
+            logger.info("[Summary Generation] LLM 응답 수신: %d characters", len(llm_response))
 
-            # JSON 파싱
-            json_match = re.search(r'```json\s*(.*?)\s*```', llm_response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
+            # JSON 파싱 (```json ... ``` 코드 블록은 고정 구분자이므로 정규식 대신 find로 잘라냄)
+            start = llm_response.find("```json")
+            end = llm_response.rfind("```")
+            if start != -1 and end > start:
+                json_str = llm_response[start + 7:end].strip()
             else:
                 json_str = llm_response.strip()
 
-            parsed = json.loads(json_str)
+            parsed = orjson.loads(json_str)
             summary = parsed.get("summary", case.title or "사건 요약 생성 실패")
             facts = parsed.get("facts", case.description or "사실관계 생성 실패")
             claims = parsed.get("claims", "청구내용 생성 실패")
 
-            logger.info(f"[Summary Generation] 자동 생성 완료")
-            logger.info(f"  - Summary: {summary[:100]}...")
-            logger.info(f"  - Facts: {facts[:100]}...")
-            logger.info(f"  - Claims: {claims[:100]}...")
+            logger.info("[Summary Generation] 자동 생성 완료")
+            logger.info("  - Summary: %s...", summary[:100])
+            logger.info("  - Facts: %s...", facts[:100])
+            logger.info("  - Claims: %s...", claims[:100])
 
             return summary, facts, claims
 
         except Exception as e:
-            logger.error(f"[Summary Generation] LLM 생성 실패: {str(e)}")
+            logger.error("[Summary Generation] LLM 생성 실패: %s", e)
             # Fallback to basic values
             return (
                 case.title or "사건 요약 없음",
@@ -9,13 +9,16 @@
 """
 
 import sys
-import json
 import hashlib
 import time
 import re
 import asyncio
 import openai
+import orjson
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Set, Tuple
 from dotenv import load_dotenv
@@ -33,22 +36,26 @@ load_dotenv()
 # ==================== API Rate Limiter ====================
 
 class RateLimiter:
-    """API 호출 속도 제한기 (토큰 버킷 알고리즘)"""
+    """API 호출 속도 제한기 (호출 간 최소 간격 보장)
+
+    호출마다 다음 호출 가능 시각을 min_interval씩 예약하고, 예약된 시각까지만 대기
+    - 읽기~갱신 사이에 await가 없어 단일 이벤트 루프에서는 Lock 없이도 안전
+    - time.monotonic() 사용 (시스템 시계 변경에 영향 없음)
+    """
 
     def __init__(self, calls_per_second: int = 50):
         self.calls_per_second = calls_per_second
         self.min_interval = 1.0 / calls_per_second
-        self.last_call_time = 0.0
-        self._lock = asyncio.Lock()
+        self._next_at = 0.0
 
     async def acquire(self):
         """다음 API 호출 전 대기"""
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self.last_call_time
-            if elapsed < self.min_interval:
-                await asyncio.sleep(self.min_interval - elapsed)
-            self.last_call_time = time.time()
+        now = time.monotonic()
+        scheduled = max(self._next_at, now)
+        self._next_at = scheduled + self.min_interval
+        wait = scheduled - now
+        if wait > 0:
+            await asyncio.sleep(wait)
 
 
 class BaseCaseCollector:
@@ -66,14 +73,25 @@ class BaseCaseCollector:
     OVERLAP_SIZE = CollectionConfig.OVERLAP_SIZE
 
     # 메타데이터 추출 패턴
-    CASE_NUMBER_PATTERN = re.compile(r'(\d{2,4}[가-힣]{1,2}\d+)')
-    LAW_ARTICLE_PATTERN = re.compile(r'([가-힣]+(?:법|령|규칙))\s*제(\d+)조')
+    # 소유 수량자(*+, ++ 등, Python 3.11+): 뒤따르는 문자 종류가 달라 되돌아가도 매칭 결과가 같으므로 백트래킹 생략
+    # 법령명([가-힣]+)은 끝의 법/령/규칙을 찾으려면 백트래킹이 필요해 일반 수량자 유지
+    CASE_NUMBER_PATTERN = re.compile(r'(\d{2,4}+[가-힣]{1,2}+\d++)')
+    LAW_ARTICLE_PATTERN = re.compile(r'([가-힣]+(?:법|령|규칙))\s*+제(\d++)조')
 
     # API 설정
     API_RATE_LIMIT = 50  # 초당 최대 호출 수
     MAX_RETRIES = 3      # 최대 재시도 횟수
     RETRY_DELAY = 2      # 재시도 대기 시간 (초)
 
+    # 임베딩 설정
+    EMBED_BATCH_SIZE = 20   # Dense 임베딩 요청 1건당 텍스트 수
+    EMBED_CONCURRENCY = 4   # 동시에 보내는 Dense 임베딩 요청 수 (OpenAI rate limit 고려)
+    # 여러 판례의 청크를 모아 한 번에 임베딩 (동시 요청 수만큼 배치가 꽉 차도록)
+    EMBED_FLUSH_CHUNKS = EMBED_BATCH_SIZE * EMBED_CONCURRENCY
+
+    # Qdrant 업로드 설정
+    QDRANT_FLUSH_SIZE = 500  # 포인트가 이만큼 쌓이면 업로드 (판례마다 왕복하지 않음)
+
     def __init__(self):
         """공통 초기화"""
         self.openai_client = get_openai_client()  # 싱글톤 사용
@@ -86,8 +104,10 @@ class BaseCaseCollector:
         self.rate_limiter = RateLimiter(calls_per_second=self.API_RATE_LIMIT)
 
         # 메타데이터 파일 경로
+        # 수집 이력/실패 케이스는 JSONL에 한 줄씩 추가 (기존 내용을 다시 읽고 쓰지 않음)
         self.metadata_path = self.data_dir.parent / "collection_metadata.json"
-        self.failed_cases_path = self.data_dir.parent / "failed_cases.json"
+        self.history_path = self.data_dir.parent / "collection_history.jsonl"
+        self.failed_cases_path = self.data_dir.parent / "failed_cases.jsonl"
 
         # 실패 케이스 목록 (세션 내)
         self.failed_cases: List[Dict[str, Any]] = []
@@ -95,6 +115,24 @@ class BaseCaseCollector:
         # Sparse 임베딩 모델 (싱글톤)
         self.sparse_model = get_sparse_model()
 
+        # Dense 임베딩 배치 요청 동시 전송용
+        self._embed_executor = ThreadPoolExecutor(max_workers=self.EMBED_CONCURRENCY)
+
+        # 임베딩 대기 청크 [(keyword, chunks)] (flush_embeddings()로 임베딩 후 업로드 버퍼로 이동)
+        self._pending_chunks: List[Tuple[str, List[Dict[str, Any]]]] = []
+        self._pending_chunk_count = 0
+
+        # Qdrant 업로드 대기 포인트 (flush_qdrant()로 업로드)
+        self._pending_points: List[Dict[str, Any]] = []
+        # 실제 Qdrant에 저장된 청크 수 (수집 결과 출력용)
+        self.saved_chunk_count = 0
+
+        # Qdrant 업로드/로컬 백업은 백그라운드에서 처리 (다음 판례 API 조회와 겹치도록)
+        # 작업자 1개 → 제출 순서대로 저장
+        self._writer_executor = ThreadPoolExecutor(max_workers=1)
+        # (작업, 작업에 포함된 {사건번호: 키워드}) - 실패 시 record_failed_case로 기록
+        self._write_futures: List[Tuple[Future, Dict[str, str]]] = []
+
     # ==================== 메타데이터 추출 ====================
 
     def extract_reference_metadata(self, detail: Dict[str, Any]) -> Dict[str, Any]:
@@ -106,22 +144,38 @@ class BaseCaseCollector:
             "original_case": detail.get("원심판결", ""),
         }
 
-        # 참조판례 추출
         ref_cases_text = detail.get("참조판례", "")
+        ref_laws_text = detail.get("참조조문", "")
+        if ref_cases_text or ref_laws_text:
+            reference_cases, reference_laws = self._extract_references(ref_cases_text or "", ref_laws_text or "")
+            metadata["reference_cases"] = list(reference_cases)
+            metadata["reference_laws"] = list(reference_laws)
+
+        return metadata
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_references(ref_cases_text: str, ref_laws_text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """참조판례/참조조문 원문 → (사건번호들, 조문들)
+
+        같은 참조 블록을 인용하는 판례가 많아 원문 쌍 단위로 결과 캐시 (불변 tuple로 반환)
+        """
+        # 참조판례 추출
+        reference_cases = ()
         if ref_cases_text:
-            matches = self.CASE_NUMBER_PATTERN.findall(ref_cases_text)
-            metadata["reference_cases"] = list(set(matches))
+            matches = BaseCaseCollector.CASE_NUMBER_PATTERN.findall(ref_cases_text)
+            reference_cases = tuple(set(matches))
 
         # 참조조문 추출
-        ref_laws_text = detail.get("참조조문", "")
+        reference_laws = ()
         if ref_laws_text:
-            matches = self.LAW_ARTICLE_PATTERN.findall(ref_laws_text)
+            matches = BaseCaseCollector.LAW_ARTICLE_PATTERN.findall(ref_laws_text)
             # ("민법", "750") -> "민법 제750조" 형태로 변환
-            metadata["reference_laws"] = list(set(
+            reference_laws = tuple(set(
                 f"{law} 제{article}조" for law, article in matches
             ))
 
-        return metadata
+        return reference_cases, reference_laws
 
     # ==================== 전문 구성 ====================
 
@@ -162,6 +216,27 @@ class BaseCaseCollector:
     # 상위 섹션만 분리 (전문 내부 【】는 분리 안함)
     # 사건명/참조조문/참조판례는 전문에 포함되어 함께 청킹됨
     TOP_LEVEL_SECTIONS = {"판시사항", "판결요지", "전문"}
+    TOP_SECTION_PATTERN = re.compile(r'【(' + '|'.join(TOP_LEVEL_SECTIONS) + r')】')
+
+    # 전처리 패턴 (클래스 로드 시 1회 컴파일, 판례마다 재사용)
+    HTML_BR_PATTERN = re.compile(r'<br\s*/?>')
+    HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+    # 문단 번호로 시작하는 줄 판별 (줄 앞 공백 제거 후 match)
+    PARA_MARKER_PATTERN = re.compile(
+        r'\[\d+\]'                  # [1], [2] 등
+        r'|[1-9]\d?[\.\)]'          # 1. 2) 등 (줄 맨 앞이므로 2025. 같은 날짜 중간은 해당 없음)
+        r'|[가-힣][\.\)]'             # 가. 나) 등
+        r'|\(\d+\)'                  # (1), (2) 등
+        r'|[①-⑳]'                    # ①, ② 등
+    )
+    PARAGRAPH_PATTERN = re.compile(r'\n{2,}')
+    # 전문 청크 내부 【】 섹션명
+    INTERNAL_SECTION_PATTERN = re.compile(r'【([^】]+)】')
+
+    # 문장 분리: 종결어미(다/음/함/됨/임) + 마침표 뒤 공백
+    SENTENCE_END_PATTERN = re.compile(r'(?<=(?:다|음|함|됨|임)\.)\s+')
+    # 번호만 있는 문장 (가. 1. (1) ① 등) - 다음 문장과 합침
+    NUMBER_ONLY_PATTERN = re.compile(r'^([가-힣]\.?|[1-9]\d?[\.\)]|\(\d+\)|[①-⑳])$')
 
     def chunk_full_text(self, full_text: str, case_info: Dict[str, Any]) -> List[Dict[str, Any]]:
         """판례 전문 청킹 (새로운 전략 적용)
@@ -172,21 +247,17 @@ class BaseCaseCollector:
         if not full_text:
             return []
 
-        # HTML 태그 제거
-        full_text = re.sub(r'<br\s*/?>', '\n', full_text)
-        full_text = re.sub(r'<[^>]+>', '', full_text)
+        # HTML 태그 제거 (태그가 없는 전문은 정규식 2회 스캔 생략)
+        if '<' in full_text:
+            full_text = self.HTML_BR_PATTERN.sub('\n', full_text)
+            full_text = self.HTML_TAG_PATTERN.sub('', full_text)
 
         # 번호 패턴 앞에 문단 구분 추가 (단일 <br/>도 문단 분리되도록)
         # 단, 헤더(】) 직후 번호 패턴은 제외 (헤더와 내용 사이 간격 방지)
-        # (?<!\d): 앞에 숫자가 없어야 함 (2025. 같은 날짜 제외)
-        full_text = re.sub(r'(?<!】)\n\s*(\[\d+\])', r'\n\n\1', full_text)  # [1], [2] 등
-        full_text = re.sub(r'(?<!】)\n\s*(?<!\d)([1-9]\d?[\.\)])', r'\n\n\1', full_text)  # 1. 2) 등 (날짜 제외)
-        full_text = re.sub(r'(?<!】)\n\s*([가-힣][\.\)])', r'\n\n\1', full_text)  # 가. 나) 등
-        full_text = re.sub(r'(?<!】)\n\s*(\(\d+\))', r'\n\n\1', full_text)  # (1), (2) 등
-        full_text = re.sub(r'(?<!】)\n\s*([①-⑳])', r'\n\n\1', full_text)  # ①, ② 등
+        full_text = self._insert_paragraph_breaks(full_text)
 
         # 문단 구분(빈 줄) 보존: \n\n+ → {{PARA}} 마커
-        full_text = re.sub(r'\n{2,}', ' {{PARA}} ', full_text)
+        full_text = self.PARAGRAPH_PATTERN.sub(' {{PARA}} ', full_text)
 
         chunks = []
         global_index = 0
@@ -230,18 +301,59 @@ class BaseCaseCollector:
 
         return chunks
 
+    def _insert_paragraph_breaks(self, text: str) -> str:
+        """번호(1. 가. (1) ① [1] 등)로 시작하는 줄 앞을 빈 줄로 분리
+
+        줄 단위 1회 순회로 처리 (줄마다 정규식 lookbehind 역추적 없음)
+        - 번호 줄 앞의 공백뿐인 줄들과 줄 앞 공백은 제거하고 빈 줄 하나로 대체
+        - 단, 헤더(】)로 끝나는 줄 바로 다음이면 구분 추가 안 함 (헤더와 내용 사이 간격 방지)
+          (헤더와 번호 줄 사이에 공백 줄이 있으면 첫 공백 줄은 남기고 그 뒤를 대체)
+        """
+        if '\n' not in text:
+            return text
+
+        lines = text.split('\n')
+        marker_match = self.PARA_MARKER_PATTERN.match
+
+        out = [lines[0]]
+        pending = []  # 마지막 내용 줄 이후의 공백뿐인 줄 (아직 출력 안 함)
+        prev_last = lines[0][-1] if lines[0] and not lines[0].isspace() else ""
+
+        for line in lines[1:]:
+            stripped = line.lstrip()
+
+            if not stripped:
+                pending.append(line)
+                continue
+
+            if marker_match(stripped):
+                if prev_last != '】':
+                    out.append('\n\n' + stripped)
+                elif pending:
+                    out.append('\n' + pending[0] + '\n\n' + stripped)
+                else:
+                    out.append('\n' + line)
+            else:
+                for blank in pending:
+                    out.append('\n' + blank)
+                out.append('\n' + line)
+
+            pending = []
+            prev_last = line[-1]
+
+        for blank in pending:
+            out.append('\n' + blank)
+
+        return ''.join(out)
+
     def _extract_internal_sections(self, content: str) -> List[str]:
-        """청크 내 【】 섹션명 추출"""
-        matches = re.findall(r'【([^】]+)】', content)
+        """청크 내 【】 섹션명 추출 (【가 없는 청크는 정규식 스캔 생략)"""
+        if '【' not in content:
+            return []
         # 공백 제거하고 중복 제거 (순서 유지)
-        seen = set()
-        result = []
-        for m in matches:
-            m_clean = m.replace(" ", "")
-            if m_clean not in seen:
-                seen.add(m_clean)
-                result.append(m_clean)
-        return result
+        return list(dict.fromkeys(
+            m.replace(" ", "") for m in self.INTERNAL_SECTION_PATTERN.findall(content)
+        ))
 
     def _process_section(self, section_name: str, content: str) -> List[str]:
         """섹션별 청킹 처리"""
@@ -328,23 +440,31 @@ class BaseCaseCollector:
         if not text:
             return []
 
-        # 종결어미(다/음/함/됨/임) + 마침표 뒤 공백에서만 분리
-        raw_sentences = re.split(r'(?<=(?:다|음|함|됨|임)\.)\s+', text)
-        raw_sentences = [s.strip() for s in raw_sentences if s.strip()]
-
-        # 번호 패턴(가. 나. 다. 1. 2. (1) ① 등)은 다음 문장과 합침
-        number_pattern = re.compile(r'^([가-힣]\.?|[1-9]\d?[\.\)]|\(\d+\)|[①-⑳])$')
+        # 종결어미(다/음/함/됨/임) + 마침표 뒤 공백 위치를 한 번 순회하며 문장 확정
+        # (분리 목록을 따로 만들지 않고, 번호 문장은 다음 문장과 바로 합침)
+        number_match = self.NUMBER_ONLY_PATTERN.match
         sentences = []
-        i = 0
-        while i < len(raw_sentences):
-            current = raw_sentences[i]
-            # 번호 패턴이면 다음 문장과 합침
-            if number_pattern.match(current) and i + 1 < len(raw_sentences):
-                sentences.append(current + ' ' + raw_sentences[i + 1])
-                i += 2
+        pending_number = None
+        start = 0
+        for match in chain(self.SENTENCE_END_PATTERN.finditer(text), (None,)):
+            end = match.start() if match else len(text)
+            sentence = text[start:end].strip()
+            if match:
+                start = match.end()
+            if not sentence:
+                continue
+
+            if pending_number is not None:
+                sentences.append(pending_number + ' ' + sentence)
+                pending_number = None
+            elif number_match(sentence):
+                pending_number = sentence
             else:
-                sentences.append(current)
-                i += 1
+                sentences.append(sentence)
+
+        # 마지막 문장이 번호뿐이면 그대로 추가
+        if pending_number is not None:
+            sentences.append(pending_number)
 
         return sentences
 
@@ -354,17 +474,18 @@ class BaseCaseCollector:
             return ""
 
         # 마지막 문장들을 합쳐서 OVERLAP_SIZE에 맞춤
-        overlap_parts = []
+        # 뒤에서부터 길이만 누적해 시작 위치를 정한 뒤 한 번에 슬라이스 (앞쪽 insert 반복 없음)
+        split_index = len(chunk_sentences)
         current_len = 0
 
         for sentence in reversed(chunk_sentences):
             if current_len + len(sentence) <= self.OVERLAP_SIZE:
-                overlap_parts.insert(0, sentence)
+                split_index -= 1
                 current_len += len(sentence) + 1
             else:
                 break
 
-        return ' '.join(overlap_parts) if overlap_parts else ""
+        return ' '.join(chunk_sentences[split_index:])
 
     def _split_top_level_sections(self, text: str) -> List[Tuple[str, str]]:
         """상위 섹션만 분리 (전문 내부 【】는 유지)
@@ -374,94 +495,114 @@ class BaseCaseCollector:
         """
         sections = []
 
-        # 상위 섹션 위치 찾기
-        top_section_pattern = r'【(' + '|'.join(self.TOP_LEVEL_SECTIONS) + r')】'
-        matches = list(re.finditer(top_section_pattern, text))
+        # 한 번의 순회로 처리: 새 헤더를 만날 때 직전 헤더 ~ 현재 헤더 사이를 직전 섹션 내용으로 확정
+        # (첫 헤더 이전 내용은 "기본정보")
+        prev_name = None
+        prev_end = 0
+        for match in self.TOP_SECTION_PATTERN.finditer(text):
+            section_content = text[prev_end:match.start()].strip()
+            if section_content:
+                sections.append((prev_name or "기본정보", section_content))
+            prev_name = match.group(1)
+            prev_end = match.end()
 
-        if not matches:
+        if prev_name is None:
             # 상위 섹션이 없으면 전체를 전문으로
             return [("전문", text.strip())]
 
-        # 첫 섹션 이전 내용
-        if matches[0].start() > 0:
-            pre_content = text[:matches[0].start()].strip()
-            if pre_content:
-                sections.append(("기본정보", pre_content))
-
-        # 각 상위 섹션 처리
-        for i, match in enumerate(matches):
-            section_name = match.group(1)
-
-            # 다음 상위 섹션까지 또는 끝까지
-            if i + 1 < len(matches):
-                section_content = text[match.end():matches[i + 1].start()]
-            else:
-                section_content = text[match.end():]
-
-            section_content = section_content.strip()
-            if section_content:
-                sections.append((section_name, section_content))
+        # 마지막 상위 섹션 ~ 끝
+        section_content = text[prev_end:].strip()
+        if section_content:
+            sections.append((prev_name, section_content))
 
         return sections
 
     # ==================== 임베딩 ====================
 
     def create_embeddings(self, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """청크들의 Dense + Sparse 임베딩 생성"""
+        """청크들의 Dense + Sparse 임베딩 생성
+
+        - Dense: EMBED_BATCH_SIZE 단위 배치를 EMBED_CONCURRENCY개까지 동시에 요청 (순차 왕복 제거)
+        - Sparse: Dense 요청이 진행되는 동안 전체 청크를 한 번에 계산
+        - Dense 요청이 최종 실패한 배치는 결과에서 제외 (기존과 동일)
+        """
         if not chunks:
             return []
 
+        batch_size = self.EMBED_BATCH_SIZE
+        texts = [c.get('content', '') for c in chunks]
+
+        # Dense 임베딩 (OpenAI) - 배치별 동시 요청
+        dense_futures = [
+            self._embed_executor.submit(self._embed_dense_batch, texts[i:i + batch_size])
+            for i in range(0, len(texts), batch_size)
+        ]
+
+        # Sparse 임베딩 (BM25) - Dense 응답을 기다리는 동안 계산
+        sparse_embeddings = list(self.sparse_model.embed(texts))
+
         results = []
-        batch_size = 20
-
-        for i in range(0, len(chunks), batch_size):
-            batch = chunks[i:i + batch_size]
-            texts = [c.get('content', '') for c in batch]
-
-            for attempt in range(3):
-                try:
-                    # Dense 임베딩 (OpenAI)
-                    response = self.openai_client.embeddings.create(
-                        model=EmbeddingConfig.CHUNK_MODEL,
-                        input=texts
-                    )
-
-                    # Sparse 임베딩 (BM25)
-                    sparse_embeddings = list(self.sparse_model.embed(texts))
-
-                    for j, chunk in enumerate(batch):
-                        chunk_with_vector = chunk.copy()
-                        chunk_with_vector["dense_vector"] = response.data[j].embedding
-
-                        sparse_emb = sparse_embeddings[j]
-                        chunk_with_vector["sparse_vector"] = {
-                            "indices": sparse_emb.indices.tolist(),
-                            "values": sparse_emb.values.tolist(),
-                        }
-                        results.append(chunk_with_vector)
-                    break  # 성공 시 루프 탈출
-
-                except openai.RateLimitError:
-                    print(f"    - Rate limit 도달, 5초 대기 후 재시도 ({attempt + 1}/3)")
-                    time.sleep(5)
-                except Exception as e:
-                    print(f"    - 임베딩 생성 실패: {e}")
-                    break
+        for batch_index, future in enumerate(dense_futures):
+            dense_vectors = future.result()
+            if dense_vectors is None:
+                continue
+
+            offset = batch_index * batch_size
+            for j, dense_vector in enumerate(dense_vectors):
+                # chunks는 process_case 안에서만 쓰이므로 복사하지 않고 벡터를 바로 추가
+                chunk = chunks[offset + j]
+                chunk["dense_vector"] = dense_vector
+
+                sparse_emb = sparse_embeddings[offset + j]
+                chunk["sparse_vector"] = {
+                    "indices": sparse_emb.indices.tolist(),
+                    "values": sparse_emb.values.tolist(),
+                }
+                results.append(chunk)
 
         return results
 
+    def _embed_dense_batch(self, texts: List[str]) -> Optional[List[List[float]]]:
+        """Dense 임베딩 배치 1건 요청 (Rate limit 시 최대 3회 재시도, 실패 시 None)"""
+        for attempt in range(3):
+            try:
+                response = self.openai_client.embeddings.create(
+                    model=EmbeddingConfig.CHUNK_MODEL,
+                    input=texts
+                )
+                return [item.embedding for item in response.data]
+
+            except openai.RateLimitError:
+                print(f"    - Rate limit 도달, 5초 대기 후 재시도 ({attempt + 1}/3)")
+                time.sleep(5)
+            except Exception as e:
+                print(f"    - 임베딩 생성 실패: {e}")
+                return None
+
+        return None
+
     # ==================== Qdrant 저장 ====================
 
     def save_to_qdrant(self, chunks_with_vectors: List[Dict[str, Any]], keyword: str) -> int:
-        """하이브리드 벡터 데이터를 Qdrant에 저장"""
+        """하이브리드 벡터 데이터를 Qdrant 업로드 버퍼에 추가
+
+        QDRANT_FLUSH_SIZE개 이상 쌓이면 한 번에 업로드, 남은 포인트는 수집 종료 시 close()에서 업로드
+
+        Returns:
+            버퍼에 추가된 포인트 수
+        """
         if not chunks_with_vectors:
             return 0
 
+        # 수집일은 배치 전체에 동일 → 청크마다 datetime.now() 호출하지 않음
+        collected_date = datetime.now().strftime("%Y-%m-%d")
+
         points = []
         for chunk in chunks_with_vectors:
             id_string = f"case_{chunk.get('case_number', '')}_{chunk.get('section', '')}_{chunk.get('chunk_index', 0)}"
-            hash_hex = hashlib.md5(id_string.encode()).hexdigest()[:16]
-            point_id = int(hash_hex, 16)
+            # MD5 앞 8바이트 → 64비트 정수 (기존 int(hexdigest()[:16], 16)과 같은 값, hex 변환 생략)
+            # 기존 포인트 ID와 일치해야 재수집 시 덮어쓰기되므로 해시 함수는 유지
+            point_id = int.from_bytes(hashlib.md5(id_string.encode()).digest()[:8], "big")
 
             points.append({
                 "id": point_id,
@@ -489,7 +630,7 @@ class BaseCaseCollector:
                     "content": chunk.get("content", ""),
                     # 수집 정보
                     "keyword": keyword,
-                    "collected_date": datetime.now().strftime("%Y-%m-%d"),
+                    "collected_date": collected_date,
                     "source": chunk.get("source", "search"),
                     "ref_from": chunk.get("ref_from", ""),
                     "type": "case",
@@ -497,13 +638,126 @@ class BaseCaseCollector:
                 }
             })
 
-        saved = self.qdrant_service.upsert_hybrid_batch(
-            collection_name=QdrantService.CASES_COLLECTION,
-            points=points,
-            batch_size=100
-        )
+        self._pending_points.extend(points)
+        if len(self._pending_points) >= self.QDRANT_FLUSH_SIZE:
+            self.flush_qdrant()
+
+        return len(points)
+
+    def flush_qdrant(self) -> int:
+        """업로드 대기 중인 포인트를 Qdrant 저장 작업으로 제출 (백그라운드 작업자에서 업로드)"""
+        if not self._pending_points:
+            return 0
+
+        points, self._pending_points = self._pending_points, []
+        cases = {p["payload"]["case_number"]: p["payload"]["keyword"] for p in points}
+        self._submit_write(cases, self._upsert_points, points)
+        return len(points)
+
+    def _upsert_points(self, points: List[Dict[str, Any]]) -> Dict[str, str]:
+        """포인트 업로드 (백그라운드 작업자에서 실행)
+
+        Returns:
+            저장에 실패한 배치에 포함된 {사건번호: 키워드}
+        """
+        failed: Dict[str, str] = {}
+        saved = 0
+        for i in range(0, len(points), 100):
+            batch = points[i:i + 100]
+            if self.qdrant_service.upsert_hybrid_vectors(QdrantService.CASES_COLLECTION, batch):
+                saved += len(batch)
+            else:
+                for point in batch:
+                    failed.setdefault(point["payload"]["case_number"], point["payload"]["keyword"])
+
+        if saved < len(points):
+            print(f"    - Qdrant 저장 실패: {len(points) - saved}/{len(points)}개 포인트")
+
+        self.saved_chunk_count += saved
+        return failed
+
+    def _submit_write(self, cases: Dict[str, str], fn, *args) -> None:
+        """저장 작업을 백그라운드 작업자에 제출 (결과 확인은 _collect_write_results)
+
+        Args:
+            cases: 작업에 포함된 {사건번호: 키워드} (작업이 예외로 끝나면 모두 실패로 기록)
+        """
+        # 끝난 작업 결과를 확인하고 목록에서 정리
+        self._collect_write_results(block=False)
+        self._write_futures.append((self._writer_executor.submit(fn, *args), cases))
+
+    def _collect_write_results(self, block: bool) -> None:
+        """끝난 백그라운드 저장 작업의 결과 확인 → 실패한 판례는 record_failed_case로 기록 (메인 스레드에서 호출)
+
+        Args:
+            block: True면 제출된 모든 작업이 끝날 때까지 대기
+        """
+        if block:
+            wait([future for future, _ in self._write_futures])
+
+        remaining = []
+        for future, cases in self._write_futures:
+            if not future.done():
+                remaining.append((future, cases))
+                continue
+
+            error = future.exception()
+            if error is not None:
+                failed, reason = cases, f"백그라운드 저장 실패: {error}"
+            else:
+                # 저장 작업은 실패한 {사건번호: 키워드}를 반환 (로컬 백업은 None)
+                failed, reason = future.result() or {}, "Qdrant 저장 실패"
+
+            for case_number, keyword in failed.items():
+                print(f"    - {case_number} {reason}")
+                self.record_failed_case(case_number, keyword, reason)
+
+        self._write_futures = remaining
+
+    def flush_embeddings(self) -> int:
+        """임베딩 대기 중인 청크를 한 번에 임베딩해 Qdrant 업로드 버퍼에 추가
+
+        Returns:
+            임베딩에 성공해 버퍼에 추가된 포인트 수
+        """
+        if not self._pending_chunks:
+            return 0
+
+        groups, self._pending_chunks = self._pending_chunks, []
+        self._pending_chunk_count = 0
+
+        # 판례 경계 없이 EMBED_BATCH_SIZE 단위로 나눠 요청 (create_embeddings는 청크에 벡터를 직접 추가)
+        all_chunks = [chunk for _, chunks in groups for chunk in chunks]
+        embedded = len(self.create_embeddings(all_chunks))
+        if embedded < len(all_chunks):
+            print(f"    - 임베딩 실패: {len(all_chunks) - embedded}/{len(all_chunks)}개 청크 제외")
+
+        queued = 0
+        for keyword, chunks in groups:
+            queued += self.save_to_qdrant([c for c in chunks if "dense_vector" in c], keyword)
+        return queued
 
-        return saved
+    def flush_pending(self) -> None:
+        """임베딩/업로드 대기 중인 데이터를 모두 저장하고 백그라운드 저장 결과 확인
+
+        임베딩 중 예외가 나도 이미 버퍼에 있는 포인트는 업로드하고, 제출된 저장 작업은 끝까지 확인
+        """
+        try:
+            self.flush_embeddings()
+        finally:
+            try:
+                self.flush_qdrant()
+            finally:
+                self._collect_write_results(block=True)
+
+    def close(self) -> None:
+        """수집 종료 처리: 대기 데이터 저장 후 작업자 종료 (수집 루프의 finally에서 반드시 호출)"""
+        try:
+            self.flush_pending()
+        finally:
+            # 저장 중 예외가 나도 제출된 작업은 끝까지 실행 후 종료
+            self._writer_executor.shutdown(wait=True)
+            self._embed_executor.shutdown(wait=True)
 
     # ==================== 로컬 백업 ====================
 
@@ -517,8 +771,8 @@ class BaseCaseCollector:
             "_keyword": keyword,  # 수집 키워드
         }
 
-        with open(backup_path, "w", encoding="utf-8") as f:
-            json.dump(backup_data, f, ensure_ascii=False, indent=2)
+        # orjson: UTF-8 그대로 출력 (ensure_ascii=False와 동일), stdlib json보다 빠름
+        backup_path.write_bytes(orjson.dumps(backup_data, option=orjson.OPT_INDENT_2))
 
     # ==================== 공통 처리 플로우 ====================
 
@@ -531,13 +785,17 @@ class BaseCaseCollector:
         """
         판례 상세정보 → 청킹 → 임베딩 → 저장
 
+        청크는 임베딩 대기열에 쌓였다가 EMBED_FLUSH_CHUNKS개가 모이면 여러 판례분을 한 번에 임베딩
+        (남은 청크는 수집 종료 시 close()에서 저장)
+
         Args:
             detail: API에서 받은 판례 상세 정보
             case_info: 메타데이터 (case_number, case_name 등)
             keyword: 검색 키워드
 
         Returns:
-            {"chunks_saved": int}
+            {"chunks_queued": int} - 임베딩 대기열에 추가된 청크 수
+            (실제 저장 수는 close() 이후 saved_chunk_count)
         """
         case_number = case_info.get("case_number", "")
 
@@ -551,20 +809,18 @@ class BaseCaseCollector:
         # 3. 청킹
         chunks = self.chunk_full_text(full_text, case_info)
         if not chunks:
-            return {"chunks_saved": 0}
+            return {"chunks_queued": 0}
 
-        # 4. 임베딩 생성
-        chunks_with_vectors = self.create_embeddings(chunks)
+        # 4. 임베딩 대기열에 추가 → 5. 모이면 임베딩 + Qdrant 저장
+        self._pending_chunks.append((keyword, chunks))
+        self._pending_chunk_count += len(chunks)
+        if self._pending_chunk_count >= self.EMBED_FLUSH_CHUNKS:
+            self.flush_embeddings()
 
-        # 5. Qdrant 저장
-        chunks_saved = 0
-        if chunks_with_vectors:
-            chunks_saved = self.save_to_qdrant(chunks_with_vectors, keyword)
+        # 6. 로컬 백업 (백그라운드)
+        self._submit_write({case_number: keyword}, self.save_local_backup, case_number, detail, keyword)
 
-        # 6. 로컬 백업
-        self.save_local_backup(case_number, detail, keyword)
-
-        return {"chunks_saved": chunks_saved}
+        return {"chunks_queued": len(chunks)}
 
     # ==================== 중복 체크 ====================
 
@@ -584,16 +840,22 @@ class BaseCaseCollector:
 
     # ==================== Collection Metadata ====================
 
+    @staticmethod
+    def _append_jsonl(path: Path, *records: Dict[str, Any]) -> None:
+        """JSONL 파일 끝에 레코드 추가 (레코드당 한 줄)"""
+        if not records:
+            return
+        with open(path, "ab") as f:
+            f.write(b"".join(orjson.dumps(record) + b"\n" for record in records))
+
     def load_collection_metadata(self) -> Dict[str, Any]:
-        """Load collection metadata from local file"""
+        """Load collection metadata snapshot from local file (history is in collection_history.jsonl)"""
         if self.metadata_path.exists():
-            with open(self.metadata_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return orjson.loads(self.metadata_path.read_bytes())
         return {
             "keywords_collected": [],
             "last_collected_date": None,
             "total_cases_collected": 0,
-            "collection_history": [],
         }
 
     def save_collection_metadata(
@@ -617,17 +879,17 @@ class BaseCaseCollector:
         metadata["last_collected_date"] = today
         metadata["total_cases_collected"] = metadata.get("total_cases_collected", 0) + cases_collected
 
-        # Add collection history
-        metadata["collection_history"].append({
+        # Add collection history (이전 형식 파일에 들어 있던 이력은 JSONL로 옮김)
+        legacy_history = metadata.pop("collection_history", [])
+        self._append_jsonl(self.history_path, *legacy_history, {
             "date": today,
             "keywords": keywords,
             "cases_collected": cases_collected,
             "summaries_collected": summaries_collected,
         })
 
-        # Save to local file
-        with open(self.metadata_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        # Save snapshot to local file
+        self.metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
 
         print(f"  -> Metadata saved: {self.metadata_path}")
 
@@ -674,7 +936,7 @@ class BaseCaseCollector:
         error: str,
         case_id: str = "",
     ) -> None:
-        """Record a failed case"""
+        """Record a failed case (바로 failed_cases.jsonl에 추가 - 수집 중단 시에도 기록 유지)"""
         failed_record = {
             "case_number": case_number,
             "case_id": case_id,
@@ -683,25 +945,13 @@ class BaseCaseCollector:
             "timestamp": datetime.now().isoformat(),
         }
         self.failed_cases.append(failed_record)
+        self._append_jsonl(self.failed_cases_path, failed_record)
 
     def save_failed_cases(self) -> None:
-        """Save failed cases list to file"""
+        """Report failed cases (기록은 record_failed_case에서 이미 파일에 추가됨)"""
         if not self.failed_cases:
             return
 
-        # Load existing failures
-        existing_failures = []
-        if self.failed_cases_path.exists():
-            with open(self.failed_cases_path, "r", encoding="utf-8") as f:
-                existing_failures = json.load(f)
-
-        # Append new failures
-        existing_failures.extend(self.failed_cases)
-
-        # Save
-        with open(self.failed_cases_path, "w", encoding="utf-8") as f:
-            json.dump(existing_failures, f, ensure_ascii=False, indent=2)
-
         print(f"  -> Failed cases saved ({len(self.failed_cases)}): {self.failed_cases_path}")
 
     def get_failed_cases_count(self) -> int:
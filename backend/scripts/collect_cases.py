@@ -92,91 +92,93 @@ class CaseCollector(BaseCaseCollector):
             print("에러: Qdrant 서버에 연결할 수 없습니다.")
             return
 
-        # 컬렉션 생성
-        self.qdrant_service.create_hybrid_collection(QdrantService.CASES_COLLECTION)
+        # 컬렉션 생성 (Dense 벡터 Scalar INT8 양자화 - 검색 측은 QuantizationConfig로 rescore)
+        self.qdrant_service.create_hybrid_collection(QdrantService.CASES_COLLECTION, quantized=True)
 
         # 기존 사건번호 로드 (중복 방지)
         self.load_existing_case_numbers()
 
-        total_saved = 0
         total_cases = 0
 
-        # API 클라이언트 세션 유지 (전체 수집 동안 재사용)
-        async with LawAPIClient() as client:
-            self.api_client = client
+        try:
+            # API 클라이언트 세션 유지 (전체 수집 동안 재사용)
+            async with LawAPIClient() as client:
+                self.api_client = client
 
-            for keyword in self.KEYWORDS:
-                print(f"\n[{keyword}] 수집 중...")
+                for keyword in self.KEYWORDS:
+                    print(f"\n[{keyword}] 수집 중...")
 
-                try:
-                    case_list = await self.fetch_case_list(keyword)
+                    try:
+                        case_list = await self.fetch_case_list(keyword)
 
-                    if not case_list:
-                        print(f"[{keyword}] 검색 결과 없음")
-                        continue
-
-                    print(f"[{keyword}] 총 {len(case_list)}건 검색됨")
-
-                    keyword_cases = 0
-                    keyword_saved = 0
-                    duplicates = 0
-
-                    for case in case_list:
-                        case_number = case.get("사건번호", "")
-                        case_id = case.get("판례일련번호", "")
-
-                        # 중복 체크
-                        if self.is_duplicate(case_number):
-                            duplicates += 1
+                        if not case_list:
+                            print(f"[{keyword}] 검색 결과 없음")
                             continue
 
-                        # 상세 조회 (Rate Limit + Retry 적용, 실패 시 자동 기록)
-                        detail = await self.fetch_case_detail(
-                            case_id,
-                            case_number=case_number,
-                            keyword=keyword
-                        )
-                        if not detail:
-                            continue
+                        print(f"[{keyword}] 총 {len(case_list)}건 검색됨")
+
+                        keyword_cases = 0
+                        keyword_queued = 0
+                        duplicates = 0
+
+                        for case in case_list:
+                            case_number = case.get("사건번호", "")
+                            case_id = case.get("판례일련번호", "")
+
+                            # 중복 체크
+                            if self.is_duplicate(case_number):
+                                duplicates += 1
+                                continue
+
+                            # 상세 조회 (Rate Limit + Retry 적용, 실패 시 자동 기록)
+                            detail = await self.fetch_case_detail(
+                                case_id,
+                                case_number=case_number,
+                                keyword=keyword
+                            )
+                            if not detail:
+                                continue
+
+                            # 메타데이터 구성
+                            case_info = {
+                                "case_number": case_number,
+                                "case_name": detail.get("사건명", ""),
+                                "court_name": detail.get("법원명", ""),
+                                "judgment_date": detail.get("선고일자", ""),
+                                "case_type": detail.get("사건종류명", ""),
+                                "judgment_type": detail.get("판결유형", ""),
+                                "case_serial_number": detail.get("판례정보일련번호", ""),
+                                "case_type_code": detail.get("사건종류코드", ""),
+                                "court_type_code": detail.get("법원종류코드", ""),
+                            }
+
+                            # 공통 처리 (청킹 → 임베딩 → 저장)
+                            result = self.process_case(detail, case_info, keyword)
+
+                            keyword_queued += result["chunks_queued"]
+                            keyword_cases += 1
+                            total_cases += 1
+                            print(f"  [{keyword}] {case_number} 처리 완료 ({keyword_cases}건째)")
+
+                        if keyword_cases > 0:
+                            print(f"[{keyword}] 완료: {keyword_cases}건 → {keyword_queued}개 청크 처리")
+                        elif duplicates > 0:
+                            print(f"[{keyword}] {len(case_list)}건 검색, {duplicates}건 중복 → 스킵")
+
+                    except Exception as e:
+                        print(f"[{keyword}] 에러: {e}")
+                        traceback.print_exc()
+                        continue
+        finally:
+            # 중단/예외 시에도 임베딩/업로드 대기 중인 청크 저장 후 작업자 종료
+            self.close()
+
+            # 실패 케이스 저장
+            self.save_failed_cases()
 
-                        # 메타데이터 구성
-                        case_info = {
-                            "case_number": case_number,
-                            "case_name": detail.get("사건명", ""),
-                            "court_name": detail.get("법원명", ""),
-                            "judgment_date": detail.get("선고일자", ""),
-                            "case_type": detail.get("사건종류명", ""),
-                            "judgment_type": detail.get("판결유형", ""),
-                            "case_serial_number": detail.get("판례정보일련번호", ""),
-                            "case_type_code": detail.get("사건종류코드", ""),
-                            "court_type_code": detail.get("법원종류코드", ""),
-                        }
-
-                        # 공통 처리 (청킹 → 임베딩 → 저장)
-                        result = self.process_case(detail, case_info, keyword)
-
-                        keyword_saved += result["chunks_saved"]
-                        total_saved += result["chunks_saved"]
-                        keyword_cases += 1
-                        total_cases += 1
-                        print(f"  [{keyword}] {case_number} 저장 완료 ({keyword_cases}건째)")
-
-                    if keyword_cases > 0:
-                        print(f"[{keyword}] 완료: {keyword_cases}건 → {keyword_saved}개 청크 저장")
-                    elif duplicates > 0:
-                        print(f"[{keyword}] {len(case_list)}건 검색, {duplicates}건 중복 → 스킵")
-
-                except Exception as e:
-                    print(f"[{keyword}] 에러: {e}")
-                    traceback.print_exc()
-                    continue
-
-        # 실패 케이스 저장
-        self.save_failed_cases()
-
-        print(f"\n수집 완료! 총 {total_cases}건 → {total_saved}개 청크 저장")
+        print(f"\n수집 완료! 총 {total_cases}건 → {self.saved_chunk_count}개 청크 저장")
         if self.get_failed_cases_count() > 0:
-            print(f"  - 실패: {self.get_failed_cases_count()}건 (failed_cases.json 참고)")
+            print(f"  - 실패: {self.get_failed_cases_count()}건 (failed_cases.jsonl 참고)")
 
 
 async def main():
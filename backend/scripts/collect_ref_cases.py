@@ -29,6 +29,9 @@ class RefCaseCollector(BaseCaseCollector):
     # "명예" -> 요약 수집함
     KEYWORDS = ["ref:명예"]
 
+    # 참조판례 사건번호 패턴: 2012도13607, 2019다12345, 98다10472 등
+    REF_CASE_NUMBER_PATTERN = re.compile(r'\d{2,4}[가-힣]+\d+')
+
     def __init__(self):
         super().__init__()
         from tool.qdrant_client import get_qdrant_client
@@ -85,8 +88,7 @@ class RefCaseCollector(BaseCaseCollector):
             content = chunk.payload.get('content', '')
 
             # 【참조판례】 이후 내용에서 사건번호 추출
-            # 패턴: 2012도13607, 2019다12345, 98다10472 등
-            case_numbers = re.findall(r'\d{2,4}[가-힣]+\d+', content)
+            case_numbers = self.REF_CASE_NUMBER_PATTERN.findall(content)
 
             if origin_case not in ref_map:
                 ref_map[origin_case] = set()
@@ -167,91 +169,93 @@ class RefCaseCollector(BaseCaseCollector):
         self.load_existing_case_numbers()
 
         total_collected = 0
-        total_saved = 0
         total_skipped = 0
         total_failed = 0
         total_summaries = 0
 
-        # API 클라이언트 세션 유지 (전체 수집 동안 재사용)
-        async with LawAPIClient() as client:
-            self.api_client = client
-
-            for keyword in self.KEYWORDS:
-                # 1. 해당 키워드 판례들의 참조판례 사건번호 추출
-                ref_map = self.get_ref_case_numbers(keyword)
-
-                # 2. 모든 참조판례 사건번호 수집 (중복 제거)
-                all_ref_numbers = set()
-                ref_from_map = {}  # 참조판례 → 원본 판례 매핑
-
-                for origin_case, ref_cases in ref_map.items():
-                    for ref_case in ref_cases:
-                        all_ref_numbers.add(ref_case)
-                        if ref_case not in ref_from_map:
-                            ref_from_map[ref_case] = []
-                        ref_from_map[ref_case].append(origin_case)
-
-                # 3. 이미 수집된 것 제외
-                new_refs = all_ref_numbers - self.collected_case_numbers
-                print(f"\n[{keyword}] 새로 수집할 참조판례: {len(new_refs)}건 (기존 {len(all_ref_numbers) - len(new_refs)}건 제외)")
-
-                # 4. 각 참조판례 수집
-                for i, ref_number in enumerate(new_refs, 1):
-                    print(f"  [{i}/{len(new_refs)}] {ref_number} 수집 중...", end=" ")
-
-                    # API로 상세 조회 (Rate Limit + Retry 적용)
-                    detail = await self.search_case_by_number(ref_number, keyword=keyword)
-
-                    if not detail:
-                        print("→ 조회 실패")
-                        total_failed += 1
-                        continue
-
-                    actual_case_number = detail.get("사건번호", ref_number)
-
-                    # 이미 수집된 경우 스킵
-                    if self.is_duplicate(actual_case_number):
-                        print("→ 이미 존재")
-                        total_skipped += 1
-                        continue
-
-                    # 메타데이터 구성 (참조판례 고유 필드 포함)
-                    case_info = {
-                        "case_number": actual_case_number,
-                        "case_name": detail.get("사건명", ""),
-                        "court_name": detail.get("법원명", ""),
-                        "judgment_date": detail.get("선고일자", ""),
-                        "case_type": detail.get("사건종류명", ""),
-                        "judgment_type": detail.get("판결유형", ""),
-                        "case_serial_number": detail.get("판례정보일련번호", ""),
-                        "case_type_code": detail.get("사건종류코드", ""),
-                        "court_type_code": detail.get("법원종류코드", ""),
-                        "source": "reference",  # 참조판례 구분
-                        "ref_from": ",".join(ref_from_map.get(ref_number, [])),
-                    }
-
-                    # 공통 처리 (청킹 → 임베딩 → 저장 → 요약)
-                    ref_keyword = f"ref:{keyword}"
-                    result = self.process_case(detail, case_info, ref_keyword, skip_summary)
-
-                    total_saved += result["chunks_saved"]
-                    if result["summary_saved"]:
-                        total_summaries += 1
-
-                    total_collected += 1
-                    print(f"→ 완료 ({result['chunks_saved']}청크)")
-
-        # 실패 케이스 저장
-        self.save_failed_cases()
+        try:
+            # API 클라이언트 세션 유지 (전체 수집 동안 재사용)
+            async with LawAPIClient() as client:
+                self.api_client = client
+
+                for keyword in self.KEYWORDS:
+                    # 1. 해당 키워드 판례들의 참조판례 사건번호 추출
+                    ref_map = self.get_ref_case_numbers(keyword)
+
+                    # 2. 모든 참조판례 사건번호 수집 (중복 제거)
+                    all_ref_numbers = set()
+                    ref_from_map = {}  # 참조판례 → 원본 판례 매핑
+
+                    for origin_case, ref_cases in ref_map.items():
+                        for ref_case in ref_cases:
+                            all_ref_numbers.add(ref_case)
+                            if ref_case not in ref_from_map:
+                                ref_from_map[ref_case] = []
+                            ref_from_map[ref_case].append(origin_case)
+
+                    # 3. 이미 수집된 것 제외
+                    new_refs = all_ref_numbers - self.collected_case_numbers
+                    print(f"\n[{keyword}] 새로 수집할 참조판례: {len(new_refs)}건 (기존 {len(all_ref_numbers) - len(new_refs)}건 제외)")
+
+                    # 4. 각 참조판례 수집
+                    for i, ref_number in enumerate(new_refs, 1):
+                        print(f"  [{i}/{len(new_refs)}] {ref_number} 수집 중...", end=" ")
+
+                        # API로 상세 조회 (Rate Limit + Retry 적용)
+                        detail = await self.search_case_by_number(ref_number, keyword=keyword)
+
+                        if not detail:
+                            print("→ 조회 실패")
+                            total_failed += 1
+                            continue
+
+                        actual_case_number = detail.get("사건번호", ref_number)
+
+                        # 이미 수집된 경우 스킵
+                        if self.is_duplicate(actual_case_number):
+                            print("→ 이미 존재")
+                            total_skipped += 1
+                            continue
+
+                        # 메타데이터 구성 (참조판례 고유 필드 포함)
+                        case_info = {
+                            "case_number": actual_case_number,
+                            "case_name": detail.get("사건명", ""),
+                            "court_name": detail.get("법원명", ""),
+                            "judgment_date": detail.get("선고일자", ""),
+                            "case_type": detail.get("사건종류명", ""),
+                            "judgment_type": detail.get("판결유형", ""),
+                            "case_serial_number": detail.get("판례정보일련번호", ""),
+                            "case_type_code": detail.get("사건종류코드", ""),
+                            "court_type_code": detail.get("법원종류코드", ""),
+                            "source": "reference",  # 참조판례 구분
+                            "ref_from": ",".join(ref_from_map.get(ref_number, [])),
+                        }
+
+                        # 공통 처리 (청킹 → 임베딩 → 저장 → 요약)
+                        ref_keyword = f"ref:{keyword}"
+                        result = self.process_case(detail, case_info, ref_keyword, skip_summary)
+
+                        if result["summary_saved"]:
+                            total_summaries += 1
+
+                        total_collected += 1
+                        print(f"→ 완료 ({result['chunks_queued']}청크)")
+        finally:
+            # 중단/예외 시에도 임베딩/업로드 대기 중인 청크 저장 후 작업자 종료
+            self.close()
+
+            # 실패 케이스 저장
+            self.save_failed_cases()
 
         print(f"\n수집 완료!")
         print(f"  - 수집: {total_collected}건")
-        print(f"  - 저장: {total_saved}개 청크")
+        print(f"  - 저장: {self.saved_chunk_count}개 청크")
         print(f"  - 요약: {total_summaries}개")
         print(f"  - 스킵(중복): {total_skipped}건")
         print(f"  - 실패: {total_failed}건")
         if self.get_failed_cases_count() > 0:
-            print(f"  - API 실패 기록: {self.get_failed_cases_count()}건 (failed_cases.json 참고)")
+            print(f"  - API 실패 기록: {self.get_failed_cases_count()}건 (failed_cases.jsonl 참고)")
 
 
 async def main():
@@ -36,7 +36,7 @@ import argparse
 import re
 import time
 import hashlib
-import json
+import orjson
 from pathlib import Path
 from typing import List, Dict, Any, Set
 from datetime import datetime
@@ -118,8 +118,7 @@ class RefCaseCollectorKure(BaseCaseCollector):
         """실패 로그 로드"""
         if self.fail_log_file.exists():
             try:
-                with open(self.fail_log_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return orjson.loads(self.fail_log_file.read_bytes())
             except:
                 pass
         return []
@@ -127,8 +126,7 @@ class RefCaseCollectorKure(BaseCaseCollector):
     def _save_fail_log(self):
         """실패 로그 저장"""
         try:
-            with open(self.fail_log_file, "w", encoding="utf-8") as f:
-                json.dump(self.fail_log, f, ensure_ascii=False, indent=2)
+            self.fail_log_file.write_bytes(orjson.dumps(self.fail_log, option=orjson.OPT_INDENT_2))
         except Exception as e:
             print(f"⚠️ 실패 로그 저장 실패: {e}")
 
@@ -150,10 +148,9 @@ class RefCaseCollectorKure(BaseCaseCollector):
         """진행 상태 로드"""
         if self.progress_file.exists():
             try:
-                with open(self.progress_file, "r", encoding="utf-8") as f:
-                    progress = json.load(f)
-                    print(f"✓ 진행 상태 로드: {len(progress.get('collected', []))}건 완료됨")
-                    return progress
+                progress = orjson.loads(self.progress_file.read_bytes())
+                print(f"✓ 진행 상태 로드: {len(progress.get('collected', []))}건 완료됨")
+                return progress
             except Exception as e:
                 print(f"⚠️ 진행 상태 로드 실패: {e}")
         return {"collected": [], "failed": [], "last_keyword": None}
@@ -161,8 +158,7 @@ class RefCaseCollectorKure(BaseCaseCollector):
     def _save_progress(self):
         """진행 상태 저장"""
         try:
-            with open(self.progress_file, "w", encoding="utf-8") as f:
-                json.dump(self.progress, f, ensure_ascii=False, indent=2)
+            self.progress_file.write_bytes(orjson.dumps(self.progress, option=orjson.OPT_INDENT_2))
         except Exception as e:
             print(f"⚠️ 진행 상태 저장 실패: {e}")
 
@@ -256,8 +252,9 @@ class RefCaseCollectorKure(BaseCaseCollector):
         points = []
         for chunk in chunks_with_vectors:
             id_string = f"case_{chunk.get('case_number', '')}_{chunk.get('section', '')}_{chunk.get('chunk_index', 0)}"
-            hash_hex = hashlib.md5(id_string.encode()).hexdigest()[:16]
-            point_id = int(hash_hex, 16)
+            # MD5 앞 8바이트 → 64비트 정수 (기존 int(hexdigest()[:16], 16)과 같은 값, hex 변환 생략)
+            # 기존 포인트 ID와 일치해야 재수집 시 덮어쓰기되므로 해시 함수는 유지
+            point_id = int.from_bytes(hashlib.md5(id_string.encode()).digest()[:8], "big")
 
             # judgment_date를 int로 변환 (기존 형식)
             judgment_date = chunk.get("judgment_date", "")
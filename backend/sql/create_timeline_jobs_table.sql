@@ -0,0 +1,41 @@
+-- 타임라인 비동기 생성 작업 테이블
+-- (여러 워커가 작업 상태를 공유하도록 DB에 저장)
+CREATE TABLE IF NOT EXISTS timeline_jobs (
+    id VARCHAR(32) PRIMARY KEY,  -- uuid4 hex
+    case_id BIGINT NOT NULL,
+    firm_id BIGINT,  -- 조회 권한 확인용
+
+    -- 작업 상태
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',  -- pending, running, done, failed
+    count INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+
+    -- 메타 정보 (UTC)
+    created_at TIMESTAMP DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'UTC'),
+    updated_at TIMESTAMP DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'UTC'),
+
+    -- Foreign Key 제약조건
+    CONSTRAINT fk_case
+        FOREIGN KEY (case_id)
+        REFERENCES cases(id)
+        ON DELETE CASCADE,
+    CONSTRAINT fk_firm
+        FOREIGN KEY (firm_id)
+        REFERENCES law_firms(id)
+        ON DELETE SET NULL
+);
+
+-- 인덱스 생성
+CREATE INDEX IF NOT EXISTS idx_timeline_jobs_case_id ON timeline_jobs(case_id);
+CREATE INDEX IF NOT EXISTS idx_timeline_jobs_created_at ON timeline_jobs(created_at);
+
+-- 코멘트 추가
+COMMENT ON TABLE timeline_jobs IS '타임라인 비동기 생성 작업 상태';
+COMMENT ON COLUMN timeline_jobs.id IS '작업 ID (uuid4 hex)';
+COMMENT ON COLUMN timeline_jobs.case_id IS '사건 ID (외래키)';
+COMMENT ON COLUMN timeline_jobs.firm_id IS '요청한 법무법인/사무실 ID';
+COMMENT ON COLUMN timeline_jobs.status IS '작업 상태 (pending/running/done/failed)';
+COMMENT ON COLUMN timeline_jobs.count IS '생성된 타임라인 수';
+COMMENT ON COLUMN timeline_jobs.error IS '실패 사유';
+COMMENT ON COLUMN timeline_jobs.created_at IS '작업 등록일시 (UTC)';
+COMMENT ON COLUMN timeline_jobs.updated_at IS '상태 갱신일시 (UTC)';
@@ -0,0 +1,163 @@
+"""
+판례 수집기 청킹 회귀 테스트
+
+_insert_paragraph_breaks / _split_into_sentences / _split_top_level_sections는
+정규식 여러 번 적용하던 기존 구현을 1회 순회 방식으로 바꾼 것이므로,
+기존 정규식 구현(아래 _legacy_*)과 출력이 완전히 같은지 비교합니다.
+"""
+
+import random
+import re
+
+import pytest
+
+from scripts.base_collector import BaseCaseCollector
+
+
+# ==================== 기존 구현 (비교 기준) ====================
+
+def _legacy_insert_paragraph_breaks(text: str) -> str:
+    """번호 패턴 앞 문단 구분 - 정규식 5회 치환 (변경 전 chunk_full_text 전처리)"""
+    text = re.sub(r'(?<!】)\n\s*(\[\d+\])', r'\n\n\1', text)
+    text = re.sub(r'(?<!】)\n\s*(?<!\d)([1-9]\d?[\.\)])', r'\n\n\1', text)
+    text = re.sub(r'(?<!】)\n\s*([가-힣][\.\)])', r'\n\n\1', text)
+    text = re.sub(r'(?<!】)\n\s*(\(\d+\))', r'\n\n\1', text)
+    text = re.sub(r'(?<!】)\n\s*([①-⑳])', r'\n\n\1', text)
+    return text
+
+
+def _legacy_split_into_sentences(text: str) -> list:
+    """문장 분리 - re.split 후 번호 문장 병합 (변경 전 구현)"""
+    if not text:
+        return []
+
+    raw_sentences = re.split(r'(?<=(?:다|음|함|됨|임)\.)\s+', text)
+    raw_sentences = [s.strip() for s in raw_sentences if s.strip()]
+
+    number_pattern = re.compile(r'^([가-힣]\.?|[1-9]\d?[\.\)]|\(\d+\)|[①-⑳])$')
+    sentences = []
+    i = 0
+    while i < len(raw_sentences):
+        current = raw_sentences[i]
+        if number_pattern.match(current) and i + 1 < len(raw_sentences):
+            sentences.append(current + ' ' + raw_sentences[i + 1])
+            i += 2
+        else:
+            sentences.append(current)
+            i += 1
+    return sentences
+
+
+def _legacy_split_top_level_sections(text: str) -> list:
+    """상위 섹션 분리 - finditer 결과 리스트를 인덱스로 순회 (변경 전 구현)"""
+    sections = []
+    pattern = r'【(' + '|'.join(BaseCaseCollector.TOP_LEVEL_SECTIONS) + r')】'
+    matches = list(re.finditer(pattern, text))
+
+    if not matches:
+        return [("전문", text.strip())]
+
+    if matches[0].start() > 0:
+        pre_content = text[:matches[0].start()].strip()
+        if pre_content:
+            sections.append(("기본정보", pre_content))
+
+    for i, match in enumerate(matches):
+        if i + 1 < len(matches):
+            section_content = text[match.end():matches[i + 1].start()]
+        else:
+            section_content = text[match.end():]
+        section_content = section_content.strip()
+        if section_content:
+            sections.append((match.group(1), section_content))
+
+    return sections
+
+
+# ==================== 입력 생성 ====================
+
+# 판례 본문에 나오는 구성 요소 (헤더, 번호, 날짜, 종결어미, 공백 종류)
+_TOKENS = [
+    "다.", "음.", "함.", "됨.", "임.", " ", "\n", "\n\n", " \n ", "  ", "\t", "\r\n",
+    "【판시사항】", "【판결요지】", "【전문】", "【이유】", "【 주 문 】", "】",
+    "[1]", "[12]", "1.", "2)", "12.", "2025.", "가.", "나)", "(1)", "(23)", "①", "⑳",
+    "법원은", "원고가", "피고의", "판단한다", "사실이", "있다", "a", "7",
+]
+
+
+def _random_text(rng: random.Random, max_tokens: int = 400) -> str:
+    return "".join(
+        rng.choice(_TOKENS) + (" " if rng.random() < 0.3 else "")
+        for _ in range(rng.randint(0, max_tokens))
+    )
+
+
+# 기존 구현에서 분기가 갈리던 경우
+_EDGE_CASES = [
+    "",
+    "\n",
+    "】\n1. 내용",                       # 헤더 직후 번호 → 구분 추가 안 함
+    "【이유】\n가. 내용\n나. 내용",
+    "【이유】\n  \n1. 내용",              # 헤더와 번호 사이 공백뿐인 줄
+    "【이유】\n\n\n(1) 내용",
+    "본문\n   \n \t\n① 내용",            # 번호 앞 공백뿐인 줄 여러 개
+    "본문\n \n본문\n  ",                  # 번호 없는 공백 줄 유지
+    "2025. 1. 1. 선고\n2025. 2. 3. 판결",  # 줄 맨 앞 날짜는 번호가 아님
+    "본문\n12. 내용\n123. 내용",
+    "[1] 첫째\n[2] 둘째",
+    "가.",
+    "가. 1. 판단한다. 피고의 주장은 이유 없음.",
+    "원고가 청구하였다.  1.  피고는 다툰다.",
+    "앞부분 【판시사항】 내용 【판결요지】 요지 【전문】 전문",
+    "【전문】【판시사항】",
+]
+
+
+@pytest.fixture(scope="module")
+def collector() -> BaseCaseCollector:
+    # 외부 연결(Qdrant/OpenAI)이 필요 없는 텍스트 처리 메서드만 사용 → __init__ 생략
+    return BaseCaseCollector.__new__(BaseCaseCollector)
+
+
+# ==================== 테스트 ====================
+
+@pytest.mark.parametrize("text", _EDGE_CASES)
+def test_insert_paragraph_breaks_edge_cases(collector, text):
+    assert collector._insert_paragraph_breaks(text) == _legacy_insert_paragraph_breaks(text)
+
+
+def test_insert_paragraph_breaks_keeps_header_spacing(collector):
+    assert collector._insert_paragraph_breaks("【이유】\n1. 내용") == "【이유】\n1. 내용"
+    assert collector._insert_paragraph_breaks("본문\n  1. 내용") == "본문\n\n1. 내용"
+    assert collector._insert_paragraph_breaks("본문\n2025. 1. 1.") == "본문\n2025. 1. 1."
+
+
+def test_insert_paragraph_breaks_random(collector):
+    rng = random.Random(36)
+    for _ in range(2000):
+        text = _random_text(rng)
+        assert collector._insert_paragraph_breaks(text) == _legacy_insert_paragraph_breaks(text), repr(text)
+
+
+@pytest.mark.parametrize("text", _EDGE_CASES)
+def test_split_into_sentences_edge_cases(collector, text):
+    assert collector._split_into_sentences(text) == _legacy_split_into_sentences(text)
+
+
+def test_split_into_sentences_random(collector):
+    rng = random.Random(3611)
+    for _ in range(2000):
+        text = _random_text(rng)
+        assert collector._split_into_sentences(text) == _legacy_split_into_sentences(text), repr(text)
+
+
+@pytest.mark.parametrize("text", _EDGE_CASES)
+def test_split_top_level_sections_edge_cases(collector, text):
+    assert collector._split_top_level_sections(text) == _legacy_split_top_level_sections(text)
+
+
+def test_split_top_level_sections_random(collector):
+    rng = random.Random(366)
+    for _ in range(2000):
+        text = _random_text(rng)
+        assert collector._split_top_level_sections(text) == _legacy_split_top_level_sections(text), repr(text)
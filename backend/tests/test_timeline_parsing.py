@@ -0,0 +1,126 @@
+"""
+타임라인 LLM 응답 파싱 테스트
+
+_TimelineEventStream(스트리밍 중 이벤트 점진 추출)과
+스트림 파싱 실패 시 폴백으로 쓰는 _parse_llm_response를 검증합니다.
+"""
+
+import orjson
+import pytest
+
+from app.services.timeline_service import TimeLineService, _TimelineEventStream
+
+
+def _event(idx: int, **extra) -> dict:
+    event = {"date": f"2024-01-{idx:02d}", "time": "10:00", "title": f"이벤트 {idx}"}
+    event.update(extra)
+    return event
+
+
+def _feed_in_chunks(text: str, size: int) -> _TimelineEventStream:
+    stream = _TimelineEventStream()
+    for i in range(0, len(text), size):
+        stream.feed(text[i:i + size])
+    return stream
+
+
+@pytest.fixture(scope="module")
+def service() -> TimeLineService:
+    # DB 세션이 필요 없는 파싱 메서드만 사용 → __init__ 생략
+    return TimeLineService.__new__(TimeLineService)
+
+
+# ==================== _TimelineEventStream ====================
+
+def test_stream_events_wrapper():
+    events = [_event(1), _event(2), _event(3)]
+    stream = _TimelineEventStream()
+    stream.feed(orjson.dumps({"events": events}).decode())
+    assert stream.events == events
+
+
+def test_stream_skips_prefix_before_array():
+    # 첫 `[` 이전의 중괄호는 이벤트로 취급하지 않음
+    events = [_event(1)]
+    text = '{"meta": {"note": "x"}, "events": ' + orjson.dumps(events).decode() + "}"
+    stream = _TimelineEventStream()
+    stream.feed(text)
+    assert stream.events == events
+
+
+def test_stream_ignores_braces_and_escaped_quotes_in_strings():
+    events = [
+        _event(1, description='중괄호 {포함} 및 "따옴표" 설명'),
+        _event(2, description="닫는 괄호만 } 그리고 역슬래시 \\ 끝"),
+        _event(3, description='이스케이프 뒤 따옴표 \\"}{'),
+    ]
+    stream = _TimelineEventStream()
+    stream.feed(orjson.dumps({"events": events}).decode())
+    assert stream.events == events
+
+
+def test_stream_nested_objects():
+    events = [_event(1, participants={"원고": {"역할": "신청인"}}), _event(2)]
+    stream = _TimelineEventStream()
+    stream.feed(orjson.dumps({"events": events}).decode())
+    assert stream.events == events
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 50])
+def test_stream_event_split_across_deltas(size):
+    events = [_event(1, description='분할 {"경계"} 테스트 \\ 끝'), _event(2), _event(3)]
+    text = orjson.dumps({"events": events}, option=orjson.OPT_INDENT_2).decode()
+    assert _feed_in_chunks(text, size).events == events
+
+
+def test_stream_emits_each_event_as_soon_as_closed():
+    stream = _TimelineEventStream()
+    stream.feed('{"events": [' + orjson.dumps(_event(1)).decode() + ', {"date": "2024-')
+    assert stream.events == [_event(1)]
+    stream.feed('01-02", "time": "10:00", "title": "이벤트 2"}]}')
+    assert stream.events == [_event(1), _event(2)]
+
+
+def test_stream_truncated_keeps_only_closed_events():
+    text = orjson.dumps({"events": [_event(1), _event(2)]}).decode()
+    truncated = text[:text.index('"이벤트 2"')]
+    stream = _TimelineEventStream()
+    stream.feed(truncated)
+    assert stream.events == [_event(1)]
+
+
+def test_stream_skips_invalid_object():
+    stream = _TimelineEventStream()
+    stream.feed('{"events": [{"date": 2024-01-01}, ' + orjson.dumps(_event(2)).decode() + "]}")
+    assert stream.events == [_event(2)]
+
+
+# ==================== 폴백 (_parse_llm_response) ====================
+
+def test_truncated_stream_falls_back_to_full_parse(service):
+    # 배열 없이 끝난 응답 → 스트림 결과가 비어 전체 응답 파싱으로 폴백
+    text = '{"events": '
+    stream = _TimelineEventStream()
+    stream.feed(text)
+    assert service._validate_timeline_items(stream.events) == []
+    assert service._parse_llm_response(text) == []
+
+
+def test_fallback_parses_bare_array(service):
+    # 스트림은 `{"events": [` 래퍼를 가정하지만 폴백은 최상위 배열도 처리
+    events = [_event(1), _event(2)]
+    assert service._parse_llm_response(orjson.dumps(events).decode()) == events
+
+
+def test_fallback_parses_events_wrapper(service):
+    events = [_event(1), _event(2)]
+    assert service._parse_llm_response(orjson.dumps({"events": events}).decode()) == events
+
+
+def test_fallback_drops_items_missing_required_fields(service):
+    items = [_event(1), {"date": "2024-01-02", "title": "시간 누락"}, "문자열"]
+    assert service._parse_llm_response(orjson.dumps({"events": items}).decode()) == [_event(1)]
+
+
+def test_fallback_non_list_events(service):
+    assert service._parse_llm_response('{"events": {"date": "2024-01-01"}}') == []
@@ -0,0 +1,71 @@
+"""
+타임라인 증거 본문 구간 선택 테스트
+
+_select_relevant_snippets의 구간 점수(질의 어휘 + 날짜 가중치),
+budget 이내 채우기, 원문 순서 재조립을 검증합니다.
+"""
+
+from app.services.timeline_service import _DATE_WEIGHT, _select_relevant_snippets, _snippet_score
+
+_WINDOW = 10
+
+
+def _windows(*texts: str) -> str:
+    # 각 구간을 정확히 _WINDOW 글자로 맞춤
+    for text in texts:
+        assert len(text) <= _WINDOW
+    return "".join(text.ljust(_WINDOW, "_") for text in texts)
+
+
+def test_short_content_returned_as_is():
+    content = "짧은 본문 계약 체결"
+    assert _select_relevant_snippets(content, {"계약"}, budget=len(content), window=_WINDOW) == content
+
+
+def test_snippet_score_counts_terms_and_dates():
+    assert _snippet_score("계약 계약 해지", {"계약"}) == 2
+    assert _snippet_score("2024-01-15 계약", {"계약"}) == 1 + _DATE_WEIGHT
+    assert _snippet_score("2024.1.15 2024년 3월 2일", set()) == 2 * _DATE_WEIGHT
+    assert _snippet_score("무관한 문장", {"계약"}) == 0
+
+
+def test_selected_windows_reassembled_in_original_order():
+    content = _windows("잡담", "계약 계약", "잡담", "잡담", "계약", "잡담")
+    result = _select_relevant_snippets(content, {"계약"}, budget=2 * _WINDOW, window=_WINDOW)
+    # 점수 순(2번째 > 5번째)이 아니라 원문 순서로 이어 붙이고, 건너뛴 구간은 "..."
+    assert result.split("\n") == ["...", content[10:20], "...", content[40:50], "..."]
+
+
+def test_adjacent_windows_not_separated():
+    content = _windows("계약", "계약", "잡담", "잡담")
+    result = _select_relevant_snippets(content, {"계약"}, budget=2 * _WINDOW, window=_WINDOW)
+    assert result.split("\n") == [content[0:10], content[10:20], "..."]
+
+
+def test_budget_limit_respected():
+    content = _windows(*["계약" for _ in range(20)])
+    for budget in (_WINDOW, 35, 7 * _WINDOW):
+        result = _select_relevant_snippets(content, {"계약"}, budget=budget, window=_WINDOW)
+        selected = [part for part in result.split("\n") if part != "..."]
+        assert sum(len(part) for part in selected) <= budget
+        assert len(selected) == budget // _WINDOW
+
+
+def test_shorter_last_window_fills_remaining_budget():
+    # 마지막 구간(5글자)은 남은 budget에 들어가면 점수가 낮아도 선택
+    content = _windows("계약", "잡담", "잡담") + "잡담잡담_"
+    result = _select_relevant_snippets(content, {"계약"}, budget=_WINDOW + 5, window=_WINDOW)
+    assert result.split("\n") == [content[0:10], "...", content[30:35]]
+
+
+def test_ties_prefer_earlier_windows():
+    content = _windows("잡담", "계약", "잡담", "계약")
+    result = _select_relevant_snippets(content, {"계약"}, budget=_WINDOW, window=_WINDOW)
+    assert result.split("\n") == ["...", content[10:20], "..."]
+
+
+def test_date_weighting_outranks_single_term():
+    # 날짜 1건(_DATE_WEIGHT점)이 질의 어휘 1회보다 우선
+    content = _windows("계약", "잡담", "2024-01-15", "잡담")
+    result = _select_relevant_snippets(content, {"계약"}, budget=_WINDOW, window=_WINDOW)
+    assert result.split("\n") == ["...", content[20:30], "..."]
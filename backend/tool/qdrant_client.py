@@ -100,6 +100,7 @@ class QdrantService:
         collection_name: str,
         dense_size: int = 1536,
         distance: Distance = Distance.COSINE,
+        quantized: bool = False,
     ) -> bool:
         """
         하이브리드 검색용 컬렉션 생성 (Dense + Sparse 벡터)
@@ -108,6 +109,7 @@ class QdrantService:
             collection_name: 컬렉션 이름
             dense_size: Dense 벡터 차원 수 (OpenAI: 1536)
             distance: 거리 측정 방식
+            quantized: Dense 벡터 Scalar INT8 양자화 적용 여부 (검색 시 rescore로 정확도 보정)
 
         Returns:
             성공 여부
@@ -128,8 +130,15 @@ class QdrantService:
                 sparse_vectors_config={
                     "sparse": SparseVectorParams(),
                 },
+                quantization_config=models.ScalarQuantization(
+                    scalar=models.ScalarQuantizationConfig(
+                        type=models.ScalarType.INT8,
+                        quantile=0.99,  # 상위 1% 이상치 제외
+                        always_ram=True,  # 양자화 벡터만 RAM 유지
+                    )
+                ) if quantized else None,
             )
-            print(f"하이브리드 컬렉션 '{collection_name}' 생성 완료")
+            print(f"하이브리드 컬렉션 '{collection_name}' 생성 완료" + (" (Scalar INT8 양자화)" if quantized else ""))
             return True
 
         except Exception as e:
@@ -280,9 +289,10 @@ class QdrantService:
             offset = None
 
             while True:
+                # case_number만 받으므로 페이지를 크게 잡아 왕복 횟수 축소
                 results, offset = self.client.scroll(
                     collection_name=self.CASES_COLLECTION,
-                    limit=100,
+                    limit=1000,
                     offset=offset,
                     with_payload=["case_number"],
                     with_vectors=False,
@@ -0,0 +1,57 @@
+"""
+프로세스 내 TTL + LRU 캐시
+검색 결과, GPT 쿼리 정제 결과 등 동일 요청 반복 시 재계산/외부 호출을 생략하기 위해 사용합니다.
+"""
+
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+def make_cache_key(**params) -> str:
+    """파라미터 → 캐시 키 (sha256)"""
+    raw = json.dumps(params, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class TTLCache:
+    """
+    thread-safe TTL + LRU 캐시
+    - 만료된 엔트리는 조회 시 제거
+    - maxsize 초과 시 가장 오래 사용되지 않은 엔트리부터 제거
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)